@@ -6,6 +6,8 @@ create and parse callback data in a type-safe and readable way, avoiding
 "magic strings" and making the code easier to maintain.
 """
 
+from functools import lru_cache
+
 from aiogram.filters.callback_data import CallbackData
 
 
@@ -44,6 +46,21 @@ class OrderCallbackFactory(CallbackData, prefix="order"):
     action: str  # "confirm_checkout", "view_details", "back_to_list"
     item_id: int | None = None  # order_id
 
+    @classmethod
+    def fast_pack(cls, action: str, item_id: int | None = None) -> str:
+        """
+        Returns the same string as ``cls(action=..., item_id=...).pack()``
+        without building and validating a model, for per-row keyboard loops.
+        """
+        if cls.__separator__ in action:
+            raise ValueError(
+                f"Separator symbol {cls.__separator__!r} can not be used "
+                f"in value action={action!r}"
+            )
+        return cls.__separator__.join(
+            (cls.__prefix__, action, "" if item_id is None else str(item_id))
+        )
+
 
 class EditProductCallbackFactory(CallbackData, prefix="edit_prod"):
     action: str  # "menu", "name", "description", "price", "stock", "change_photo"
@@ -72,6 +89,24 @@ class ProfileCallbackFactory(CallbackData, prefix="profile"):
     action: str  # "edit_phone", "edit_email", "manage_addr", "add_addr", "delete_addr"
     address_id: int | None = None
 
+    @classmethod
+    def unpack(cls, value: str) -> "ProfileCallbackFactory":
+        """
+        Parses the fixed ``profile:<action>:<address_id>`` layout directly,
+        skipping the generic per-field loop; the model is still validated and
+        errors are the same TypeError/ValueError the callback filters expect.
+        """
+        parts = value.split(cls.__separator__)
+        if len(parts) != 3:
+            raise TypeError(
+                f"Callback data {cls.__name__!r} takes 2 arguments "
+                f"but {len(parts) - 1} were given"
+            )
+        prefix, action, address_id = parts
+        if prefix != cls.__prefix__:
+            raise ValueError(f"Bad prefix ({prefix!r} != {cls.__prefix__!r})")
+        return cls(action=action, address_id=address_id or None)
+
 
 class DeliveryAdminCallbackFactory(CallbackData, prefix="admin_del"):
     """CallbackData for admin delivery management."""
@@ -87,3 +122,23 @@ class PickupTypeCallbackFactory(CallbackData, prefix="pp_type"):
 
 class PickupSelectCallbackFactory(CallbackData, prefix="pp_sel"):
     pickup_point_id: int
+
+
+# Per-row keyboard loops pack the same (action, id) pairs on every redraw and
+# for every user; a cache hit skips model validation and formatting entirely.
+@lru_cache(maxsize=4096)
+def pack_catalog(action: str, item_id: int) -> str:
+    """Cached ``CatalogCallbackFactory(action=..., item_id=...).pack()``."""
+    return CatalogCallbackFactory(action=action, item_id=item_id).pack()
+
+
+@lru_cache(maxsize=4096)
+def pack_cart(action: str, item_id: int) -> str:
+    """Cached ``CartCallbackFactory(action=..., item_id=...).pack()``."""
+    return CartCallbackFactory(action=action, item_id=item_id).pack()
+
+
+@lru_cache(maxsize=4096)
+def pack_profile(action: str, address_id: int | None = None) -> str:
+    """Cached ``ProfileCallbackFactory(action=..., address_id=...).pack()``."""
+    return ProfileCallbackFactory(action=action, address_id=address_id).pack()
@@ -0,0 +1,23 @@
+"""
+Custom filter to match the action of already unpacked callback data.
+"""
+
+from aiogram.filters import Filter
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery
+
+
+class CallbackAction(Filter):
+    """
+    Pairs with a router-level ``SomeCallbackFactory.filter()``, which unpacks
+    the payload once and injects ``callback_data``; each handler then only
+    compares the action.
+    """
+
+    def __init__(self, action: str) -> None:
+        self.action = action
+
+    async def __call__(
+        self, query: CallbackQuery, callback_data: CallbackData | None = None
+    ) -> bool:
+        return getattr(callback_data, "action", None) == self.action
@@ -8,6 +8,7 @@ from ecombot.bot.callback_data import DeliveryAdminCallbackFactory
 from ecombot.core.manager import central_manager as manager
 from ecombot.db.crud import deliveries as deliveries_crud
 from ecombot.schemas.enums import DeliveryType
+from ecombot.services import delivery_service
 
 
 router = Router()
@@ -69,6 +70,7 @@ async def cb_toggle_delivery_type(
         return
 
     option = await deliveries_crud.toggle_delivery_option(session, dt_enum)
+    delivery_service.reset_delivery_cache_on_commit(session)
     status_key = "active" if option.is_active else "inactive"
     status_text = manager.get_message("delivery", status_key)
     type_text = manager.get_message("delivery", dt_enum.message_key)
@@ -11,6 +11,7 @@ from ecombot.bot.callback_data import PickupTypeCallbackFactory
 from ecombot.core.manager import central_manager as manager
 from ecombot.db.crud import deliveries as deliveries_crud
 from ecombot.schemas.enums import DeliveryType
+from ecombot.services import delivery_service
 
 from .menu import send_delivery_menu
 from .states import PickupPointStates
@@ -119,6 +120,7 @@ async def cb_toggle_pickup_point(
     pp_id = callback_data.item_id
     pp = await deliveries_crud.toggle_pickup_point_status(session, pp_id)
     if pp:
+        delivery_service.reset_delivery_cache_on_commit(session)
         await query.answer(manager.get_message("delivery", "status_updated"))
         # Refresh view
         # We can reuse the callback_data since it has the item_id, just change action
@@ -134,6 +136,7 @@ async def cb_delete_pickup_point(
 ):
     pp_id = callback_data.item_id
     if await deliveries_crud.delete_pickup_point(session, pp_id):
+        delivery_service.reset_delivery_cache_on_commit(session)
         await query.answer(manager.get_message("delivery", "pp_deleted"))
     await cb_list_pickup_points(query, session)
 
@@ -236,6 +239,7 @@ async def process_pp_hours(message: Message, state: FSMContext, session: AsyncSe
         pickup_type=data["pickup_type"],
         working_hours=hours,
     )
+    delivery_service.reset_delivery_cache_on_commit(session)
 
     await message.answer(
         manager.get_message("delivery", "pp_created", name=new_pp.name)
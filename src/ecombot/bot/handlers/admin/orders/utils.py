@@ -8,6 +8,7 @@ from ecombot.bot.keyboards.admin import get_admin_order_details_keyboard
 from ecombot.core.manager import central_manager as manager
 from ecombot.logging_setup import log
 from ecombot.schemas.dto import OrderDTO
+from ecombot.utils import format_datetime
 
 
 class InvalidQueryDataError(ValueError):
@@ -32,7 +33,7 @@ def generate_order_details_text(order: OrderDTO) -> str:
         manager.get_message(
             "admin_orders",
             "order_date_field",
-            date=order.created_at.strftime("%Y-%m-%d %H:%M"),
+            date=format_datetime(order.created_at, "%Y-%m-%d %H:%M"),
         ),
         manager.get_message(
             "admin_orders",
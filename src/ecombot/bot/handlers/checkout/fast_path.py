@@ -19,6 +19,7 @@ from ecombot.db.models import PickupPoint
 from ecombot.db.models import User
 from ecombot.logging_setup import logger
 from ecombot.schemas.dto import OrderDTO
+from ecombot.schemas.dto import PickupPointDTO
 from ecombot.schemas.enums import DeliveryType
 from ecombot.services import cart_service
 from ecombot.services import notification_service
@@ -66,7 +67,7 @@ async def fast_path_pickup_selected(
         None,
         cart,
         is_pickup=True,
-        pickup_point=pickup_point,
+        pickup_point=PickupPointDTO.model_validate(pickup_point),
     )
     keyboard = get_fast_checkout_confirmation_keyboard()
 
@@ -9,12 +9,12 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 from aiogram.types import Message
 from aiogram.types import ReplyKeyboardRemove
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ecombot.bot.callback_data import CheckoutCallbackFactory
 from ecombot.bot.callback_data import PickupSelectCallbackFactory
 from ecombot.bot.keyboards.checkout import get_checkout_confirmation_keyboard
+from ecombot.bot.keyboards.checkout import get_pickup_point_selection_keyboard
 from ecombot.bot.keyboards.checkout import get_request_contact_keyboard
 from ecombot.bot.middlewares import MessageInteractionMiddleware
 from ecombot.core.manager import central_manager as manager
@@ -23,15 +23,14 @@ from ecombot.db.models import User
 from ecombot.logging_setup import logger
 from ecombot.schemas.enums import DeliveryType
 from ecombot.services import cart_service
+from ecombot.services import delivery_service
 from ecombot.services import notification_service
 from ecombot.services import order_service
 from ecombot.services import user_service
 from ecombot.services.order_service import OrderPlacementError
 
 from .states import CheckoutFSM
-from .utils import check_courier_availability
 from .utils import generate_slow_path_confirmation_text
-from .utils import get_active_pickup_points
 
 
 router = Router()
@@ -65,12 +64,12 @@ async def get_phone_handler(
         await message.answer(error_msg)
         return
 
-    await state.update_data(phone=phone.strip())
-
-    courier_available = await check_courier_availability(session)
+    # Everything this step writes is flushed to FSM storage in a single call
+    fsm_data = {"phone": phone.strip()}
+    courier_available = await delivery_service.check_courier_availability(session)
 
     if courier_available:
-        await state.update_data(is_pickup=False)
+        await state.update_data(**fsm_data, is_pickup=False)
         address_msg = manager.get_message("checkout", "slow_path_address")
         await message.answer(
             address_msg,
@@ -78,34 +77,31 @@ async def get_phone_handler(
         )
         await state.set_state(CheckoutFSM.getting_address)
     else:
-        await state.update_data(is_pickup=True)
         # Skip address step for pickup
         # Remove the 'Request Contact' keyboard
         await message.answer("✅", reply_markup=ReplyKeyboardRemove())
 
-        pickup_points = await get_active_pickup_points(session)
+        pickup_points = await delivery_service.get_active_pickup_points(session)
+        fsm_data["is_pickup"] = True
+        if len(pickup_points) != 1:
+            await state.update_data(**fsm_data)
+
         if len(pickup_points) > 1:
-            builder = InlineKeyboardBuilder()
-            for pp in pickup_points:
-                builder.button(
-                    text=pp.name,
-                    callback_data=PickupSelectCallbackFactory(pickup_point_id=pp.id),
-                )
-            builder.adjust(1)
             await message.answer(
                 manager.get_message("delivery", "select_pickup_point"),
-                reply_markup=builder.as_markup(),
+                reply_markup=get_pickup_point_selection_keyboard(pickup_points),
             )
             await state.set_state(CheckoutFSM.choosing_pickup_slow)
         elif len(pickup_points) == 1:
             pp = pickup_points[0]
             pickup_address = f"{pp.name} ({pp.address})"
-            await state.update_data(
+            # update_data returns the merged FSM data, so no extra get_data trip
+            user_data = await state.update_data(
+                **fsm_data,
                 pickup_point_id=pp.id,
                 pickup_point_name=pickup_address,
                 address=pickup_address,
             )
-            user_data = await state.get_data()
             cart_data = await cart_service.get_user_cart(session, db_user.telegram_id)
             confirmation_text = generate_slow_path_confirmation_text(
                 user_data, cart_data, is_pickup=True
@@ -141,13 +137,11 @@ async def slow_path_pickup_selected(
         return
 
     pickup_address = f"{pickup_point.name} ({pickup_point.address})"
-    await state.update_data(
+    user_data = await state.update_data(
         pickup_point_id=pp_id,
         pickup_point_name=pickup_address,
         address=pickup_address,
     )
-
-    user_data = await state.get_data()
     cart_data = await cart_service.get_user_cart(session, db_user.telegram_id)
     confirmation_text = generate_slow_path_confirmation_text(
         user_data, cart_data, is_pickup=True
@@ -169,8 +163,7 @@ async def get_address_handler(
         await message.answer(error_msg)
         return
 
-    await state.update_data(address=message.text.strip())
-    user_data = await state.get_data()
+    user_data = await state.update_data(address=message.text.strip())
     cart_data = await cart_service.get_user_cart(session, db_user.telegram_id)
 
     confirmation_text = generate_slow_path_confirmation_text(
@@ -3,22 +3,16 @@
 from html import escape
 from typing import Optional
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from ecombot.config import settings
 from ecombot.core.manager import central_manager as manager
 from ecombot.db.models import DeliveryAddress
-from ecombot.db.models import DeliveryOption
-from ecombot.db.models import PickupPoint
 from ecombot.db.models import User
 from ecombot.schemas.dto import CartDTO
-from ecombot.schemas.enums import DeliveryType
+from ecombot.schemas.dto import PickupPointDTO
 
 
 def get_default_address(user: User) -> Optional[DeliveryAddress]:
     """Get user's default delivery address."""
-    return next((addr for addr in user.addresses if addr.is_default), None)
+    return user.default_address
 
 
 def determine_missing_info(
@@ -37,41 +31,12 @@ def determine_missing_info(
     return missing_info
 
 
-async def check_courier_availability(session: AsyncSession) -> bool:
-    """
-    Checks if courier delivery is available.
-    Returns True if global DELIVERY is True AND there is at least one active
-    DeliveryOption that is NOT a pickup type.
-    """
-    if not settings.DELIVERY:
-        return False
-
-    pickup_types = [
-        DeliveryType.PICKUP_STORE,
-        DeliveryType.PICKUP_LOCKER,
-        DeliveryType.PICKUP_CURBSIDE,
-    ]
-    stmt = select(DeliveryOption).where(
-        DeliveryOption.is_active,
-        DeliveryOption.delivery_type.notin_(pickup_types),
-    )
-    result = await session.execute(stmt)
-    return bool(result.scalars().first())
-
-
-async def get_active_pickup_points(session: AsyncSession) -> list[PickupPoint]:
-    """Returns a list of all active pickup points."""
-    stmt = select(PickupPoint).where(PickupPoint.is_active)
-    result = await session.execute(stmt)
-    return list(result.scalars().all())
-
-
 def generate_fast_path_confirmation_text(
     user: User,
     default_address: Optional[DeliveryAddress],
     cart: CartDTO,
     is_pickup: bool = False,
-    pickup_point: Optional[PickupPoint] = None,
+    pickup_point: Optional[PickupPointDTO] = None,
 ) -> str:
     """Generate confirmation text for fast path checkout."""
     currency = manager.get_message("common", "currency_symbol")
@@ -104,23 +69,20 @@ def generate_slow_path_confirmation_text(
     user_data: dict, cart: CartDTO, is_pickup: bool = False
 ) -> str:
     """Generate confirmation text for slow path checkout."""
-    if not is_pickup:
-        msg = manager.get_message(
-            "checkout",
-            "slow_path_confirm",
-            name=escape(user_data.get("name", "")),
-            phone=escape(user_data.get("phone", "")),
-            address=escape(user_data.get("address", "")),
-        )
+    if is_pickup:
+        template_key = "pickup_slow_confirm"
+        address = user_data.get("pickup_point_name", "Pickup")
     else:
-        pp_name = user_data.get("pickup_point_name", "Pickup")
-        msg = manager.get_message(
-            "checkout",
-            "pickup_slow_confirm",
-            name=escape(user_data.get("name", "")),
-            phone=escape(user_data.get("phone", "")),
-            address=escape(pp_name),
-        )
+        template_key = "slow_path_confirm"
+        address = user_data.get("address", "")
+
+    msg = manager.get_message(
+        "checkout",
+        template_key,
+        name=escape(user_data.get("name", "")),
+        phone=escape(user_data.get("phone", "")),
+        address=escape(address),
+    )
 
     return (
         msg
@@ -18,7 +18,12 @@ from .states import EditProfile
 
 # Create main router and include all sub-routers
 router = Router()
-router.callback_query.middleware(MessageInteractionMiddleware())
+
+# Only these sub-routers' callback handlers take ``callback_message``. The
+# navigation callbacks skip the middleware: "do_nothing" never touches the
+# message, and "cancel_fsm" answers inaccessible-message callbacks itself.
+main_profile.router.callback_query.middleware(MessageInteractionMiddleware())
+address_management.router.callback_query.middleware(MessageInteractionMiddleware())
 
 router.include_router(main_profile.router)
 router.include_router(address_management.router)
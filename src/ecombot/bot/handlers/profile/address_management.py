@@ -1,5 +1,6 @@
 """Address management handlers."""
 
+import asyncio
 from html import escape
 
 from aiogram import F
@@ -10,21 +11,28 @@ from aiogram.types import Message
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ecombot.bot.callback_data import ProfileCallbackFactory
+from ecombot.bot.filters.callback_action import CallbackAction
 from ecombot.bot.keyboards.common import get_cancel_keyboard
 from ecombot.bot.keyboards.profile import get_address_details_keyboard
 from ecombot.core.manager import central_manager as manager
 from ecombot.db.models import User
 from ecombot.logging_setup import log
 from ecombot.services import user_service
+from ecombot.services.user_service import AddressNotFoundError
 
 from .states import AddAddress
+from .utils import log_handler_error
 from .utils import send_address_management_view
 
 
 router = Router()
+# Every callback handled here carries ProfileCallbackFactory data. Unpacking
+# it once in a router-level filter injects ``callback_data`` for all handlers,
+# which then only compare the action instead of each re-parsing the payload.
+router.callback_query.filter(ProfileCallbackFactory.filter())
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "view_addr"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("view_addr"))
 async def view_address_handler(
     query: CallbackQuery,
     callback_data: ProfileCallbackFactory,
@@ -41,48 +49,46 @@ async def view_address_handler(
         return
 
     try:
-        addresses = await user_service.get_all_user_addresses(session, db_user.id)
-        address = next((addr for addr in addresses if addr.id == address_id), None)
-
-        if not address:
-            await query.answer(
-                manager.get_message("profile", "address_not_found"), show_alert=True
-            )
-            return
-
+        address = await user_service.get_user_address(session, db_user.id, address_id)
         prefix = (
             manager.get_message("profile", "default_address_prefix")
             if address.is_default
             else manager.get_message("profile", "address_prefix")
         )
-        text = (
-            f"<b>{prefix}</b>\n\n"
-            f"{manager.get_message(
-                'profile', 'address_label_field',
-                label=escape(address.address_label)
-            )}\n\n"
-            f"{manager.get_message(
-                'profile', 'address_full_field',
-                address=escape(address.full_address)
-            )}"
+        # Both field templates come from the manager's per-language memo
+        text = "\n\n".join(
+            (
+                f"<b>{prefix}</b>",
+                manager.get_message(
+                    "profile",
+                    "address_label_field",
+                    label=escape(address.address_label),
+                ),
+                manager.get_message(
+                    "profile",
+                    "address_full_field",
+                    address=escape(address.full_address),
+                ),
+            )
         )
 
         keyboard = get_address_details_keyboard()
         await callback_message.edit_text(text, reply_markup=keyboard)
         await query.answer()
 
-    except Exception as e:
-        log.error(
-            f"Failed to load address details for user {db_user.id}: {e}",
-            exc_info=True,
+    except AddressNotFoundError:
+        await query.answer(
+            manager.get_message("profile", "address_not_found"), show_alert=True
         )
+    except Exception as e:
+        log_handler_error(e, "Failed to load address details for user {}", db_user.id)
         await query.answer(
             manager.get_message("profile", "failed_load_address_details"),
             show_alert=True,
         )
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "manage_addr"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("manage_addr"))
 async def manage_addresses_handler(
     query: CallbackQuery,
     session: AsyncSession,
@@ -94,7 +100,7 @@ async def manage_addresses_handler(
     await query.answer()
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "delete_addr"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("delete_addr"))
 async def delete_address_handler(
     query: CallbackQuery,
     callback_data: ProfileCallbackFactory,
@@ -107,20 +113,24 @@ async def delete_address_handler(
     if address_id:
         try:
             await user_service.delete_address(session, db_user.id, address_id)
-            await query.answer(
-                manager.get_message("profile", "success_address_deleted"),
-                show_alert=True,
+            # The ack and the re-render are independent Bot API calls and only
+            # the re-render touches the session, so their round trips overlap.
+            await asyncio.gather(
+                query.answer(
+                    manager.get_message("profile", "success_address_deleted"),
+                    show_alert=True,
+                ),
+                send_address_management_view(callback_message, session, db_user),
             )
-            await send_address_management_view(callback_message, session, db_user)
         except Exception as e:
-            log.exception("Error deleting address {}", e)
+            log_handler_error(e, "Error deleting address for user {}", db_user.id)
             await query.answer(
                 manager.get_message("profile", "error_address_delete_failed"),
                 show_alert=True,
             )
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "set_default_addr"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("set_default_addr"))
 async def set_default_address_handler(
     query: CallbackQuery,
     callback_data: ProfileCallbackFactory,
@@ -133,21 +143,25 @@ async def set_default_address_handler(
     if address_id is not None:
         try:
             await user_service.set_user_default_address(session, db_user.id, address_id)
-            await query.answer(
-                manager.get_message("profile", "success_default_address_updated"),
-                show_alert=False,
+            await asyncio.gather(
+                query.answer(
+                    manager.get_message("profile", "success_default_address_updated"),
+                    show_alert=False,
+                ),
+                send_address_management_view(callback_message, session, db_user),
             )
-            await send_address_management_view(callback_message, session, db_user)
         except Exception as e:
-            log.exception(f"Error setting default address for user {db_user.id}: {e}")
+            log_handler_error(
+                e, "Error setting default address for user {}", db_user.id
+            )
             await query.answer(
                 manager.get_message("profile", "error_default_address_failed"),
                 show_alert=True,
             )
     else:
         log.error(
-            f"set_default_address_handler called without an address_id"
-            f" for user {db_user.id}"
+            "set_default_address_handler called without an address_id for user {}",
+            db_user.id,
         )
         await query.answer(
             manager.get_message("profile", "error_missing_address_id"),
@@ -155,7 +169,7 @@ async def set_default_address_handler(
         )
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "add_addr"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("add_addr"))
 async def add_address_start(
     query: CallbackQuery,
     state: FSMContext,
@@ -182,7 +196,7 @@ async def add_address_get_label(message: Message, state: FSMContext):
             reply_markup=get_cancel_keyboard(),
         )
     except Exception as e:
-        log.error(f"Failed to send address prompt: {e}", exc_info=True)
+        log_handler_error(e, "Failed to send address prompt")
 
 
 @router.message(AddAddress.getting_address, F.text)
@@ -190,7 +204,7 @@ async def add_address_get_address(
     message: Message, state: FSMContext, session: AsyncSession, db_user: User
 ):
     """Step 3 (Add Address): Receive the full address and save it."""
-    await state.update_data(address=message.text)
+    # The state is cleared below, so the address is never written back to it
     address_data = await state.get_data()
 
     try:
@@ -198,14 +212,14 @@ async def add_address_get_address(
             session=session,
             user_id=db_user.id,
             label=address_data["label"],
-            address=address_data["address"],
+            address=message.text,
         )
         await message.answer(manager.get_message("profile", "success_address_saved"))
 
         await send_address_management_view(message, session, db_user)
 
     except Exception as e:
-        log.error(f"Failed to add address for user {db_user.id}: {e}", exc_info=True)
+        log_handler_error(e, "Failed to add address for user {}", db_user.id)
         await message.answer(
             manager.get_message("profile", "error_address_save_failed")
         )
@@ -1,7 +1,11 @@
 """Main profile viewing and editing handlers."""
 
+import asyncio
+import contextlib
+
 from aiogram import F
 from aiogram import Router
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
@@ -9,18 +13,54 @@ from aiogram.types import Message
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ecombot.bot.callback_data import ProfileCallbackFactory
+from ecombot.bot.filters.callback_action import CallbackAction
 from ecombot.bot.keyboards.common import get_cancel_keyboard
 from ecombot.bot.keyboards.profile import get_profile_keyboard
 from ecombot.core.manager import central_manager as manager
 from ecombot.db.models import User
 from ecombot.logging_setup import log
+from ecombot.schemas.dto import UserProfileDTO
 from ecombot.services import user_service
 
 from .states import EditProfile
 from .utils import format_profile_text
+from .utils import log_handler_error
 
 
 router = Router()
+# Profile callback data is unpacked once here; handlers match on its action.
+router.callback_query.filter(ProfileCallbackFactory.filter())
+
+
+async def _show_updated_profile(
+    message: Message, state: FSMContext, user_profile: UserProfileDTO, success: str
+) -> None:
+    """
+    Render the success notice and refreshed profile into the edit prompt
+    message, falling back to a new message if it can't be edited.
+    """
+    text = f"{success}\n\n{format_profile_text(user_profile)}"
+    keyboard = get_profile_keyboard()
+    prompt_message_id = (await state.get_data()).get("prompt_message_id")
+
+    if prompt_message_id is not None:
+        try:
+            await message.bot.edit_message_text(
+                text=text,
+                chat_id=message.chat.id,
+                message_id=prompt_message_id,
+                reply_markup=keyboard,
+            )
+            return
+        except TelegramBadRequest as e:
+            log.warning("Failed to edit profile prompt for {}: {}", message.chat.id, e)
+    await message.answer(text, reply_markup=keyboard)
+
+
+async def _delete_input(message: Message) -> None:
+    """Delete the user's input message; a failed cleanup is not an error."""
+    with contextlib.suppress(TelegramBadRequest):
+        await message.delete()
 
 
 @router.message(Command("profile"))
@@ -29,7 +69,7 @@ async def profile_handler(message: Message, session: AsyncSession, db_user: User
     try:
         user_profile = await user_service.get_user_profile(session, db_user)
     except Exception as e:
-        log.error(f"Failed to load profile for user {db_user.id}: {e}", exc_info=True)
+        log_handler_error(e, "Failed to load profile for user {}", db_user.id)
         await message.answer(
             manager.get_message("profile", "error_profile_load_failed")
         )
@@ -40,7 +80,7 @@ async def profile_handler(message: Message, session: AsyncSession, db_user: User
     await message.answer(text, reply_markup=keyboard)
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "profile_back_main"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("profile_back_main"))
 async def back_to_profile_handler(
     query: CallbackQuery,
     session: AsyncSession,
@@ -54,7 +94,7 @@ async def back_to_profile_handler(
         keyboard = get_profile_keyboard()
         await callback_message.edit_text(text, reply_markup=keyboard)
     except Exception as e:
-        log.error(f"Failed to load profile for user {db_user.id}: {e}", exc_info=True)
+        log_handler_error(e, "Failed to load profile for user {}", db_user.id)
         await callback_message.edit_text(
             manager.get_message("profile", "error_profile_load_failed")
         )
@@ -62,7 +102,7 @@ async def back_to_profile_handler(
     await query.answer()
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "edit_phone"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("edit_phone"))
 async def edit_phone_start(
     query: CallbackQuery,
     state: FSMContext,
@@ -74,6 +114,7 @@ async def edit_phone_start(
         reply_markup=get_cancel_keyboard(),
     )
     await state.set_state(EditProfile.getting_phone)
+    await state.update_data(prompt_message_id=callback_message.message_id)
     await query.answer()
 
 
@@ -85,17 +126,22 @@ async def edit_phone_get_phone(
     new_phone = message.text
 
     try:
-        await user_service.update_profile_details(
+        user_profile = await user_service.update_profile_details(
             session=session, user_id=db_user.id, update_data={"phone": new_phone}
         )
-        await message.answer(manager.get_message("profile", "success_phone_updated"))
-
-        await session.refresh(db_user)
-        await message.delete()  # Delete the "new phone number" message
-        await profile_handler(message, session, db_user)
+        # Removing the user's input and refreshing the profile are independent
+        await asyncio.gather(
+            _delete_input(message),
+            _show_updated_profile(
+                message,
+                state,
+                user_profile,
+                manager.get_message("profile", "success_phone_updated"),
+            ),
+        )
 
     except Exception as e:
-        log.error(f"Failed to update phone for user {db_user.id}: {e}", exc_info=True)
+        log_handler_error(e, "Failed to update phone for user {}", db_user.id)
         await message.answer(
             manager.get_message("profile", "error_phone_update_failed")
         )
@@ -103,7 +149,7 @@ async def edit_phone_get_phone(
         await state.clear()
 
 
-@router.callback_query(ProfileCallbackFactory.filter(F.action == "edit_email"))  # type: ignore[arg-type]
+@router.callback_query(CallbackAction("edit_email"))
 async def edit_email_start(
     query: CallbackQuery,
     state: FSMContext,
@@ -115,6 +161,7 @@ async def edit_email_start(
         reply_markup=get_cancel_keyboard(),
     )
     await state.set_state(EditProfile.getting_email)
+    await state.update_data(prompt_message_id=callback_message.message_id)
     await query.answer()
 
 
@@ -127,17 +174,21 @@ async def edit_email_get_email(
     new_email = message.text
 
     try:
-        await user_service.update_profile_details(
+        user_profile = await user_service.update_profile_details(
             session=session, user_id=db_user.id, update_data={"email": new_email}
         )
-        await message.answer(manager.get_message("profile", "success_email_updated"))
-
-        await session.refresh(db_user)
-        await message.delete()  # Clean up the user's "new email" message
-        await profile_handler(message, session, db_user)
+        await asyncio.gather(
+            _delete_input(message),
+            _show_updated_profile(
+                message,
+                state,
+                user_profile,
+                manager.get_message("profile", "success_email_updated"),
+            ),
+        )
 
     except Exception as e:
-        log.error(f"Failed to update email for user {db_user.id}: {e}", exc_info=True)
+        log_handler_error(e, "Failed to update email for user {}", db_user.id)
         await message.answer(
             manager.get_message("profile", "error_email_update_failed")
         )
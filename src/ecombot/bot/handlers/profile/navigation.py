@@ -45,6 +45,10 @@ async def cancel_fsm_handler(
         try:
             await event.message.edit_text("Action cancelled.")
         except TelegramBadRequest as e:
-            log.warning(f"Failed to edit cancellation message: {e}")
+            log.warning("Failed to edit cancellation message: {}", e)
             await event.message.answer("Action cancelled.")
         await event.answer()
+    elif isinstance(event, CallbackQuery):
+        # This router runs without MessageInteractionMiddleware, so a stale
+        # callback (inaccessible message) must still be answered here.
+        await event.answer("Action cancelled.", show_alert=True)
@@ -2,40 +2,57 @@
 
 from html import escape
 
+from aiogram.exceptions import TelegramAPIError
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import Message
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ecombot.bot.keyboards.profile import get_address_management_keyboard
 from ecombot.core.manager import central_manager as manager
+from ecombot.core.messages import render_template
 from ecombot.db.models import User
 from ecombot.logging_setup import log
 from ecombot.services import user_service
+from ecombot.services.user_service import AddressNotFoundError
+
+
+# Failures whose message says all there is to know; no traceback is rendered
+EXPECTED_ERRORS = (SQLAlchemyError, TelegramAPIError, AddressNotFoundError)
+
+
+def log_handler_error(error: Exception, message: str, *args) -> None:
+    """
+    Log a handler failure: expected errors as a one-line warning, anything
+    else with its traceback.
+    """
+    if isinstance(error, EXPECTED_ERRORS):
+        log.opt(depth=1).warning(message + ": {}", *args, error)
+    else:
+        log.opt(depth=1, exception=error).error(message + ": {}", *args, error)
 
 
 def format_profile_text(user_profile) -> str:
     """Format the main profile view text."""
-    default_address = next(
-        (addr for addr in user_profile.addresses if addr.is_default), None
-    )
+    default_address = user_profile.default_address
 
-    phone_text = (
-        escape(user_profile.phone)
-        if user_profile.phone
-        else manager.get_message("profile", "not_set_text")
-    )
-    email_text = (
-        escape(user_profile.email)
-        if user_profile.email
-        else manager.get_message("profile", "not_set_text")
+    phone, email = user_profile.phone, user_profile.email
+    # Resolved at most once, and only when a field is actually missing
+    not_set_text = (
+        "" if phone and email else manager.get_message("profile", "not_set_text")
     )
+    phone_text = escape(phone) if phone else not_set_text
+    email_text = escape(email) if email else not_set_text
 
-    text = manager.get_message("profile", "profile_header") + manager.get_message(
-        "profile",
-        "profile_template",
-        name=escape(user_profile.first_name),
-        phone=phone_text,
-        email=email_text,
+    # The memoized raw template is rendered directly, skipping get_message's
+    # kwargs forwarding while keeping its fallback for broken translations.
+    text = manager.get_message("profile", "profile_header") + render_template(
+        manager.get_template("profile", "profile_template"),
+        {
+            "name": escape(user_profile.first_name),
+            "phone": phone_text,
+            "email": email_text,
+        },
     )
 
     if default_address:
@@ -48,16 +65,18 @@ def format_profile_text(user_profile) -> str:
 
 def format_address_management_text(addresses) -> str:
     """Format the address management view text."""
-    text = manager.get_message("profile", "address_management_header")
+    header = manager.get_message("profile", "address_management_header")
     if not addresses:
-        text += manager.get_message("profile", "no_addresses_message")
-    else:
-        for addr in addresses:
-            text += (
-                f"📍 <b>{escape(addr.address_label)}</b>:\n"
-                f"<code>{escape(addr.full_address)}</code>\n\n"
-            )
-    return text
+        return header + manager.get_message("profile", "no_addresses_message")
+    # Joined once so long address books stay linear. No trailing separator:
+    # Telegram trims it, and the view's html_text comparison must match.
+    return header + "\n\n".join(
+        [
+            f"📍 <b>{escape(addr.address_label)}</b>:\n"
+            f"<code>{escape(addr.full_address)}</code>"
+            for addr in addresses
+        ]
+    )
 
 
 async def send_address_management_view(
@@ -69,23 +88,28 @@ async def send_address_management_view(
         keyboard = get_address_management_keyboard(addresses)
         text = format_address_management_text(addresses)
 
+        # Skip the round trip when the message already shows this exact view
+        if message.html_text == text and message.reply_markup == keyboard:
+            return
+
         try:
             await message.edit_text(text, reply_markup=keyboard)
         except TelegramBadRequest as e:
             if "message is not modified" in e.message:
                 # Message content is the same, no need to update
                 return
-            log.warning(f"Failed to edit message for user {db_user.id}: {e}")
+            log.warning("Failed to edit message for user {}: {}", db_user.id, e)
             try:
                 await message.answer(text, reply_markup=keyboard)
             except Exception as fallback_e:
                 log.error(
-                    f"Failed to send fallback message for user {db_user.id}: "
-                    f"{fallback_e}"
+                    "Failed to send fallback message for user {}: {}",
+                    db_user.id,
+                    fallback_e,
                 )
                 raise fallback_e from e
     except Exception as e:
-        log.error(f"Failed to load addresses for user {db_user.id}: {e}", exc_info=True)
+        log_handler_error(e, "Failed to load addresses for user {}", db_user.id)
         await message.answer(
             manager.get_message("profile", "error_addresses_load_failed")
         )
@@ -1,5 +1,8 @@
 """Admin-related keyboards."""
 
+from functools import lru_cache
+
+from aiogram.types import InlineKeyboardButton
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
@@ -13,45 +16,47 @@ from ..callback_data import AdminNavCallbackFactory
 from ..callback_data import DeliveryAdminCallbackFactory
 from ..callback_data import EditProductCallbackFactory
 from ..callback_data import OrderCallbackFactory
+from .common import static_button
+
+
+# OrderStatus has fixed members, so the admin filter/status callback strings
+# are formatted once at import; status callbacks only interpolate the order id.
+_ADMIN_FILTER_CB = {s: f"admin_order_filter:{s.value}" for s in OrderStatus}
+_ADMIN_STATUS_CB = {s: f"admin_order_status:%d:{s.value}" for s in OrderStatus}
+_CB_VIEW_ORDERS = AdminCallbackFactory(action="view_orders").pack()
+
+_ADMIN_PANEL_ACTIONS = (
+    "add_category",
+    "delete_category",
+    "restore_category",
+    "add_product",
+    "edit_product",
+    "delete_product",
+    "restore_product",
+    "view_orders",
+)
+_ADMIN_PANEL_LABELS = (*_ADMIN_PANEL_ACTIONS, "manage_delivery")
 
 
 def get_admin_panel_keyboard() -> InlineKeyboardMarkup:
     """Builds the main keyboard for the admin panel."""
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=manager.get_message("keyboards", "add_category"),
-        callback_data=AdminCallbackFactory(action="add_category"),
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "delete_category"),
-        callback_data=AdminCallbackFactory(action="delete_category"),
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "restore_category"),
-        callback_data=AdminCallbackFactory(action="restore_category"),
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "add_product"),
-        callback_data=AdminCallbackFactory(action="add_product"),
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "edit_product"),
-        callback_data=AdminCallbackFactory(action="edit_product"),
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "delete_product"),
-        callback_data=AdminCallbackFactory(action="delete_product"),
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "restore_product"),
-        callback_data=AdminCallbackFactory(action="restore_product"),
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "view_orders"),
-        callback_data=AdminCallbackFactory(action="view_orders"),
+    return _build_admin_panel_keyboard(
+        manager.get_templates("keyboards", _ADMIN_PANEL_LABELS)
     )
+
+
+@lru_cache(maxsize=None)
+def _build_admin_panel_keyboard(label_texts: tuple[str, ...]) -> InlineKeyboardMarkup:
+    # Nothing mutates a returned markup, so one instance per label set is shared.
+    *action_texts, manage_delivery_text = label_texts
+    builder = InlineKeyboardBuilder()
+    for action, text in zip(_ADMIN_PANEL_ACTIONS, action_texts, strict=True):
+        builder.button(
+            text=text,
+            callback_data=AdminCallbackFactory(action=action),
+        )
     builder.button(
-        text=manager.get_message("keyboards", "manage_delivery"),
+        text=manage_delivery_text,
         callback_data=DeliveryAdminCallbackFactory(action="menu"),
     )
     builder.adjust(3, 4, 2)
@@ -60,144 +65,171 @@ def get_admin_panel_keyboard() -> InlineKeyboardMarkup:
 
 def get_admin_orders_list_keyboard(orders: list[OrderDTO]) -> InlineKeyboardMarkup:
     """Builds a keyboard for the admin orders list with back to filters button."""
-    builder = InlineKeyboardBuilder()
+    # One order per row, so rows are assembled directly instead of going
+    # through InlineKeyboardBuilder's per-button bookkeeping.
     currency = manager.get_message("common", "currency_symbol")
-    for order in orders:
-        builder.button(
-            text=f"{order.order_number} - {order.contact_name}"
-            f" ({currency}{order.total_price:.2f})",
-            callback_data=OrderCallbackFactory(action="view_details", item_id=order.id),
-        )
-
-    builder.button(
-        text=manager.get_message("keyboards", "back_to_filters"),
-        callback_data=AdminCallbackFactory(action="view_orders"),
+    pack = OrderCallbackFactory.fast_pack
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"{order.order_number} - {order.contact_name}"
+                f" ({currency}{order.total_price:.2f})",
+                callback_data=pack("view_details", order.id),
+            )
+        ]
+        for order in orders
+    ]
+    rows.append(
+        [
+            static_button(
+                manager.get_message("keyboards", "back_to_filters"), _CB_VIEW_ORDERS
+            )
+        ]
     )
-    builder.adjust(1)
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+_ORDER_FILTERS = (
+    ("pending", OrderStatus.PENDING),
+    ("processing", OrderStatus.PROCESSING),
+    ("pickup_ready", OrderStatus.PICKUP_READY),
+    ("shipped", OrderStatus.SHIPPED),
+    ("mark_as_paid", OrderStatus.PAID),
+    ("completed", OrderStatus.COMPLETED),
+    ("cancelled", OrderStatus.CANCELLED),
+    ("refunded", OrderStatus.REFUNDED),
+    ("failed", OrderStatus.FAILED),
+)
+_ORDER_FILTER_LABELS = (*(key for key, _ in _ORDER_FILTERS), "back_to_admin_panel")
 
 
 def get_admin_order_filters_keyboard() -> InlineKeyboardMarkup:
     """Builds a keyboard for filtering orders in the admin panel."""
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=manager.get_message("keyboards", "pending"),
-        callback_data=f"admin_order_filter:{OrderStatus.PENDING.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "processing"),
-        callback_data=f"admin_order_filter:{OrderStatus.PROCESSING.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "pickup_ready"),
-        callback_data=f"admin_order_filter:{OrderStatus.PICKUP_READY.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "shipped"),
-        callback_data=f"admin_order_filter:{OrderStatus.SHIPPED.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "mark_as_paid"),
-        callback_data=f"admin_order_filter:{OrderStatus.PAID.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "completed"),
-        callback_data=f"admin_order_filter:{OrderStatus.COMPLETED.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "cancelled"),
-        callback_data=f"admin_order_filter:{OrderStatus.CANCELLED.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "refunded"),
-        callback_data=f"admin_order_filter:{OrderStatus.REFUNDED.value}",
-    )
-    builder.button(
-        text=manager.get_message("keyboards", "failed"),
-        callback_data=f"admin_order_filter:{OrderStatus.FAILED.value}",
+    return _build_admin_order_filters_keyboard(
+        manager.get_templates("keyboards", _ORDER_FILTER_LABELS)
     )
+
+
+@lru_cache(maxsize=None)
+def _build_admin_order_filters_keyboard(
+    label_texts: tuple[str, ...],
+) -> InlineKeyboardMarkup:
+    *filter_texts, back_text = label_texts
+    builder = InlineKeyboardBuilder()
+    for (_, status), text in zip(_ORDER_FILTERS, filter_texts, strict=True):
+        builder.button(
+            text=text,
+            callback_data=_ADMIN_FILTER_CB[status],
+        )
     builder.button(
-        text=manager.get_message("keyboards", "back_to_admin_panel"),
+        text=back_text,
         callback_data=AdminCallbackFactory(action="back_main"),
     )
     builder.adjust(2, 2, 2)
     return builder.as_markup()
 
 
+# Next statuses an admin may move an order to, with their button label keys.
+# Final statuses have no entry, and therefore no action buttons.
+_CANCEL = (OrderStatus.CANCELLED, "cancel_order")
+_ORDER_TRANSITIONS: dict[OrderStatus, tuple[tuple[OrderStatus, str], ...]] = {
+    OrderStatus.PENDING: ((OrderStatus.PROCESSING, "mark_as_processing"), _CANCEL),
+    OrderStatus.PROCESSING: (
+        (OrderStatus.PICKUP_READY, "mark_as_pickup_ready"),
+        (OrderStatus.SHIPPED, "mark_as_shipped"),
+        _CANCEL,
+    ),
+    OrderStatus.PICKUP_READY: (
+        (OrderStatus.PAID, "mark_as_paid"),
+        (OrderStatus.SHIPPED, "mark_as_shipped"),
+        _CANCEL,
+    ),
+    OrderStatus.SHIPPED: (
+        (OrderStatus.PAID, "mark_as_paid"),
+        (OrderStatus.COMPLETED, "mark_as_completed"),
+        _CANCEL,
+    ),
+    OrderStatus.PAID: ((OrderStatus.COMPLETED, "mark_as_completed"), _CANCEL),
+}
+
+_ORDER_DETAILS_LABELS = (
+    "mark_as_processing",
+    "mark_as_pickup_ready",
+    "mark_as_shipped",
+    "mark_as_paid",
+    "mark_as_completed",
+    "cancel_order",
+    "back_to_orders_list",
+)
+
+
 def get_admin_order_details_keyboard(order: OrderDTO) -> InlineKeyboardMarkup:
     """Builds the action keyboard for an admin viewing an order's details."""
-    builder = InlineKeyboardBuilder()
+    return _build_admin_order_details_keyboard(
+        order.id,
+        order.status,
+        manager.get_templates("keyboards", _ORDER_DETAILS_LABELS),
+    )
 
-    # Logic to show the NEXT valid status, not all statuses
-    if order.status == OrderStatus.PENDING:
-        builder.button(
-            text=manager.get_message("keyboards", "mark_as_processing"),
-            callback_data=f"admin_order_status:{order.id}:{OrderStatus.PROCESSING.value}",
-        )
-    elif order.status == OrderStatus.PROCESSING:
-        builder.button(
-            text=manager.get_message("keyboards", "mark_as_pickup_ready"),
-            callback_data=f"admin_order_status:{order.id}:{OrderStatus.PICKUP_READY.value}",
-        )
-        builder.button(
-            text=manager.get_message("keyboards", "mark_as_shipped"),
-            callback_data=f"admin_order_status:{order.id}:{OrderStatus.SHIPPED.value}",
-        )
-    elif order.status in [OrderStatus.SHIPPED, OrderStatus.PICKUP_READY]:
-        builder.button(
-            text=manager.get_message("keyboards", "mark_as_paid"),
-            callback_data=f"admin_order_status:{order.id}:{OrderStatus.PAID.value}",
-        )
-    if order.status == OrderStatus.PICKUP_READY:
-        builder.button(
-            text=manager.get_message("keyboards", "mark_as_shipped"),
-            callback_data=f"admin_order_status:{order.id}:{OrderStatus.SHIPPED.value}",
-        )
-    elif order.status in [
-        OrderStatus.PAID,
-        OrderStatus.PICKUP_READY,
-        OrderStatus.SHIPPED,
-    ]:
-        builder.button(
-            text=manager.get_message("keyboards", "mark_as_completed"),
-            callback_data=f"admin_order_status:{order.id}:{OrderStatus.COMPLETED.value}",
-        )
 
-    if order.status not in [
-        OrderStatus.COMPLETED,
-        OrderStatus.CANCELLED,
-        OrderStatus.REFUNDED,
-        OrderStatus.FAILED,
-    ]:
+@lru_cache(maxsize=1024)
+def _build_admin_order_details_keyboard(
+    order_id: int, status: OrderStatus, label_texts: tuple[str, ...]
+) -> InlineKeyboardMarkup:
+    # Keyed by status too, so a status change never serves a stale keyboard
+    text = dict(zip(_ORDER_DETAILS_LABELS, label_texts, strict=True))
+    builder = InlineKeyboardBuilder()
+
+    # Show only the NEXT valid statuses, not all statuses
+    for next_status, label_key in _ORDER_TRANSITIONS.get(status, ()):
         builder.button(
-            text=manager.get_message("keyboards", "cancel_order"),
-            callback_data=f"admin_order_status:{order.id}:{OrderStatus.CANCELLED.value}",
+            text=text[label_key],
+            callback_data=_ADMIN_STATUS_CB[next_status] % order_id,
         )
 
     builder.button(
-        text=manager.get_message("keyboards", "back_to_orders_list"),
-        callback_data=f"admin_order_filter:{order.status.value}",
+        text=text["back_to_orders_list"],
+        callback_data=_ADMIN_FILTER_CB[status],
     )
     builder.adjust(1)
     return builder.as_markup()
 
 
+_EDIT_PRODUCT_FIELDS = (
+    ("name", "edit_name"),
+    ("description", "edit_description"),
+    ("price", "edit_price"),
+    ("stock", "edit_stock"),
+    ("change_photo", "change_photo"),
+)
+_EDIT_PRODUCT_LABELS = (*(key for _, key in _EDIT_PRODUCT_FIELDS), "back_to_products")
+
+
 def get_edit_product_menu_keyboard(
     product_id: int,
     product_list_message_id: int,  # The ID of the message to go back to
     category_id: int,
 ) -> InlineKeyboardMarkup:
     """Builds a keyboard for choosing which product attribute to edit."""
-    builder = InlineKeyboardBuilder()
+    return _build_edit_product_menu_keyboard(
+        product_id,
+        product_list_message_id,
+        category_id,
+        manager.get_templates("keyboards", _EDIT_PRODUCT_LABELS),
+    )
 
-    fields_to_edit = {
-        "name": manager.get_message("keyboards", "edit_name"),
-        "description": manager.get_message("keyboards", "edit_description"),
-        "price": manager.get_message("keyboards", "edit_price"),
-        "stock": manager.get_message("keyboards", "edit_stock"),
-    }
 
-    for field, text in fields_to_edit.items():
+@lru_cache(maxsize=1024)
+def _build_edit_product_menu_keyboard(
+    product_id: int,
+    product_list_message_id: int,
+    category_id: int,
+    label_texts: tuple[str, ...],
+) -> InlineKeyboardMarkup:
+    # Re-rendered after every edit of the same product, so repeats are hits
+    *field_texts, back_text = label_texts
+    builder = InlineKeyboardBuilder()
+    for (field, _), text in zip(_EDIT_PRODUCT_FIELDS, field_texts, strict=True):
         builder.button(
             text=text,
             callback_data=EditProductCallbackFactory(
@@ -206,14 +238,7 @@ def get_edit_product_menu_keyboard(
         )
 
     builder.button(
-        text=manager.get_message("keyboards", "change_photo"),
-        callback_data=EditProductCallbackFactory(
-            action="change_photo", product_id=product_id
-        ),
-    )
-
-    builder.button(
-        text=manager.get_message("keyboards", "back_to_products"),
+        text=back_text,
         callback_data=AdminNavCallbackFactory(
             action="back_to_product_list",
             target_message_id=product_list_message_id,
@@ -227,13 +252,23 @@ def get_edit_product_menu_keyboard(
 
 def get_add_product_image_keyboard() -> InlineKeyboardMarkup:
     """Builds a keyboard for the image upload step (Done/Skip)."""
+    return _build_add_product_image_keyboard(
+        manager.get_message("keyboards", "done"),
+        manager.get_message("keyboards", "skip"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_add_product_image_keyboard(
+    done_text: str, skip_text: str
+) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(
-        text=manager.get_message("keyboards", "done"),
+        text=done_text,
         callback_data=AddProductImageCallbackFactory(action="done"),
     )
     builder.button(
-        text=manager.get_message("keyboards", "skip"),
+        text=skip_text,
         callback_data=AddProductImageCallbackFactory(action="skip"),
     )
     builder.adjust(2)
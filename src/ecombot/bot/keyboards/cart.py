@@ -2,13 +2,13 @@
 
 from aiogram.types import InlineKeyboardButton
 from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from ecombot.core.manager import central_manager as manager
 from ecombot.schemas.dto import CartDTO
 
-from ..callback_data import CartCallbackFactory
-from ..callback_data import CatalogCallbackFactory
+from ..callback_data import pack_cart
+from ..callback_data import pack_catalog
+from .common import static_button
 
 
 def get_cart_keyboard(cart: CartDTO) -> InlineKeyboardMarkup:
@@ -16,58 +16,58 @@ def get_cart_keyboard(cart: CartDTO) -> InlineKeyboardMarkup:
     Builds an interactive keyboard for the shopping cart.
     Features a compact, single-row design for item actions.
     """
-    builder = InlineKeyboardBuilder()
+    # The layout is fixed (an action row and a name row per item), so rows are
+    # assembled directly instead of going through InlineKeyboardBuilder.
+    rows: list[list[InlineKeyboardButton]] = []
+    add_row = rows.append
+    decrease_text = manager.get_message("cart", "decrease_quantity")
+    increase_text = manager.get_message("cart", "increase_quantity")
+    remove_text = manager.get_message("cart", "remove_item")
 
     for item in cart.items:
-        builder.row(
-            InlineKeyboardButton(
-                text=manager.get_message("cart", "decrease_quantity"),
-                callback_data=CartCallbackFactory(
-                    action="decrease", item_id=item.id
-                ).pack(),
-            ),
-            InlineKeyboardButton(
-                text=f"{item.quantity}",
-                callback_data=f"quantity_{item.id}",
-            ),
-            InlineKeyboardButton(
-                text=manager.get_message("cart", "increase_quantity"),
-                callback_data=CartCallbackFactory(
-                    action="increase", item_id=item.id
-                ).pack(),
-            ),
-            InlineKeyboardButton(
-                text=manager.get_message("cart", "remove_item"),
-                callback_data=CartCallbackFactory(
-                    action="remove", item_id=item.id
-                ).pack(),
-            ),
+        item_id = item.id
+        add_row(
+            [
+                InlineKeyboardButton(
+                    text=decrease_text,
+                    callback_data=pack_cart("decrease", item_id),
+                ),
+                InlineKeyboardButton(
+                    text=f"{item.quantity}",
+                    callback_data=f"quantity_{item_id}",
+                ),
+                InlineKeyboardButton(
+                    text=increase_text,
+                    callback_data=pack_cart("increase", item_id),
+                ),
+                InlineKeyboardButton(
+                    text=remove_text,
+                    callback_data=pack_cart("remove", item_id),
+                ),
+            ]
         )
-        builder.row(
-            InlineKeyboardButton(
-                text=f"{item.product.name}",
-                callback_data=CatalogCallbackFactory(
-                    action="view_product", item_id=item.product.id
-                ).pack(),
-            )
+        add_row(
+            [
+                InlineKeyboardButton(
+                    text=f"{item.product.name}",
+                    callback_data=pack_catalog("view_product", item.product.id),
+                )
+            ]
         )
 
     action_buttons = []
     if cart.items:
         action_buttons.append(
-            InlineKeyboardButton(
-                text=manager.get_message("cart", "checkout_button"),
-                callback_data="checkout_start",
+            static_button(
+                manager.get_message("cart", "checkout_button"), "checkout_start"
             )
         )
     action_buttons.append(
-        InlineKeyboardButton(
-            text=manager.get_message("keyboards", "catalog"),
-            callback_data=CatalogCallbackFactory(
-                action="back_to_main", item_id=0
-            ).pack(),
+        static_button(
+            manager.get_message("keyboards", "catalog"),
+            pack_catalog("back_to_main", 0),
         )
     )
-    builder.row(*action_buttons)
+    add_row(action_buttons)
 
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=rows)
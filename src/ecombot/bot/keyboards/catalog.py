@@ -1,5 +1,7 @@
 """Catalog-related keyboards."""
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
@@ -9,6 +11,11 @@ from ecombot.schemas.dto import ProductDTO
 
 from ..callback_data import CartCallbackFactory
 from ..callback_data import CatalogCallbackFactory
+from ..callback_data import pack_catalog
+
+
+# Callback data of fixed buttons, packed once at import
+_CB_BACK_TO_MAIN = CatalogCallbackFactory(action="back_to_main", item_id=0).pack()
 
 
 def get_catalog_categories_keyboard(
@@ -19,9 +26,7 @@ def get_catalog_categories_keyboard(
     for category in categories:
         builder.button(
             text=category.name,
-            callback_data=CatalogCallbackFactory(
-                action="view_category", item_id=category.id
-            ),
+            callback_data=pack_catalog("view_category", category.id),
         )
     builder.adjust(3)
     return builder.as_markup()
@@ -34,13 +39,11 @@ def get_catalog_products_keyboard(products: list[ProductDTO]) -> InlineKeyboardM
     for product in products:
         builder.button(
             text=f"{product.name} - {currency}{product.price:.2f}",
-            callback_data=CatalogCallbackFactory(
-                action="view_product", item_id=product.id
-            ),
+            callback_data=pack_catalog("view_product", product.id),
         )
     builder.button(
         text=manager.get_message("catalog", "back_to_categories"),
-        callback_data=CatalogCallbackFactory(action="back_to_main", item_id=0),
+        callback_data=_CB_BACK_TO_MAIN,
     )
     builder.adjust(1)
     return builder.as_markup()
@@ -48,16 +51,27 @@ def get_catalog_products_keyboard(products: list[ProductDTO]) -> InlineKeyboardM
 
 def get_product_details_keyboard(product: ProductDTO) -> InlineKeyboardMarkup:
     """Builds a keyboard for a single product view."""
+    return _build_product_details_keyboard(
+        product.id,
+        product.category.id,
+        manager.get_message("catalog", "add_to_cart"),
+        manager.get_message("keyboards", "back_to_products"),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_product_details_keyboard(
+    product_id: int, category_id: int, add_text: str, back_text: str
+) -> InlineKeyboardMarkup:
+    # A pure function of a few scalars; repeat views of a product share it.
     builder = InlineKeyboardBuilder()
     builder.button(
-        text=manager.get_message("catalog", "add_to_cart"),
-        callback_data=CartCallbackFactory(action="add", item_id=product.id),
+        text=add_text,
+        callback_data=CartCallbackFactory(action="add", item_id=product_id),
     )
     builder.button(
-        text=manager.get_message("keyboards", "back_to_products"),
-        callback_data=CatalogCallbackFactory(
-            action="view_category", item_id=product.category.id
-        ),
+        text=back_text,
+        callback_data=pack_catalog("view_category", category_id),
     )
     builder.adjust(1)
     return builder.as_markup()
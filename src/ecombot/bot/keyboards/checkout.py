@@ -1,13 +1,18 @@
 """Checkout-related keyboards."""
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.types import KeyboardButton
 from aiogram.types import ReplyKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from ecombot.core.manager import central_manager as manager
+from ecombot.schemas.dto import PickupPointDTO
 
 from ..callback_data import CheckoutCallbackFactory
+from ..callback_data import PickupSelectCallbackFactory
 
 
 def get_request_contact_keyboard() -> ReplyKeyboardMarkup:
@@ -15,15 +20,16 @@ def get_request_contact_keyboard() -> ReplyKeyboardMarkup:
     Builds a reply keyboard with a single button to request the user's contact.
     This is a special button type that prompts the user to share their phone number.
     """
+    return _build_request_contact_keyboard(
+        manager.get_message("keyboards", "share_phone")
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_request_contact_keyboard(share_phone_text: str) -> ReplyKeyboardMarkup:
+    # Nothing mutates a returned markup, so one instance per label is shared.
     return ReplyKeyboardMarkup(
-        keyboard=[
-            [
-                KeyboardButton(
-                    text=manager.get_message("keyboards", "share_phone"),
-                    request_contact=True,
-                )
-            ]
-        ],
+        keyboard=[[KeyboardButton(text=share_phone_text, request_contact=True)]],
         resize_keyboard=True,
         one_time_keyboard=True,
     )
@@ -34,13 +40,23 @@ def get_checkout_confirmation_keyboard() -> InlineKeyboardMarkup:
     Builds the final Yes/No keyboard for confirming the order,
     used in the "slow path" FSM.
     """
+    return _build_checkout_confirmation_keyboard(
+        manager.get_message("keyboards", "confirm"),
+        manager.get_message("keyboards", "cancel_short"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_checkout_confirmation_keyboard(
+    confirm_text: str, cancel_text: str
+) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(
-        text=manager.get_message("keyboards", "confirm"),
+        text=confirm_text,
         callback_data=CheckoutCallbackFactory(action="confirm"),
     )
     builder.button(
-        text=manager.get_message("keyboards", "cancel_short"),
+        text=cancel_text,
         callback_data=CheckoutCallbackFactory(action="cancel"),
     )
     builder.adjust(2)
@@ -49,18 +65,43 @@ def get_checkout_confirmation_keyboard() -> InlineKeyboardMarkup:
 
 def get_fast_checkout_confirmation_keyboard() -> InlineKeyboardMarkup:
     """Builds the keyboard for the 'fast path' checkout confirmation."""
+    return _build_fast_checkout_confirmation_keyboard(
+        manager.get_message("keyboards", "confirm_order"),
+        manager.get_message("keyboards", "edit_details"),
+        manager.get_message("keyboards", "cancel"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_fast_checkout_confirmation_keyboard(
+    confirm_text: str, edit_text: str, cancel_text: str
+) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(
-        text=manager.get_message("keyboards", "confirm_order"),
+        text=confirm_text,
         callback_data=CheckoutCallbackFactory(action="confirm"),
     )
     builder.button(
-        text=manager.get_message("keyboards", "edit_details"),
+        text=edit_text,
         callback_data=CheckoutCallbackFactory(action="edit_details"),
     )
     builder.button(
-        text=manager.get_message("keyboards", "cancel"),
+        text=cancel_text,
         callback_data=CheckoutCallbackFactory(action="cancel"),
     )
     builder.adjust(1)
     return builder.as_markup()
+
+
+def get_pickup_point_selection_keyboard(
+    pickup_points: Iterable[PickupPointDTO],
+) -> InlineKeyboardMarkup:
+    """Builds a one-per-row keyboard for choosing a pickup point."""
+    builder = InlineKeyboardBuilder()
+    for pp in pickup_points:
+        builder.button(
+            text=pp.name,
+            callback_data=PickupSelectCallbackFactory(pickup_point_id=pp.id),
+        )
+    builder.adjust(1)
+    return builder.as_markup()
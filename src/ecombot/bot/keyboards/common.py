@@ -1,5 +1,8 @@
 """Common keyboards used across multiple modules."""
 
+from functools import lru_cache
+
+from aiogram.types import InlineKeyboardButton
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
@@ -13,9 +16,21 @@ def get_delete_confirmation_keyboard(
     item_id: int,
 ) -> InlineKeyboardMarkup:
     """Builds a generic Yes/No confirmation keyboard for deletion."""
+    return _build_delete_confirmation_keyboard(
+        action,
+        item_id,
+        manager.get_message("keyboards", "yes_delete"),
+        manager.get_message("keyboards", "no_go_back"),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_delete_confirmation_keyboard(
+    action: str, item_id: int, yes_text: str, no_text: str
+) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(
-        text=manager.get_message("keyboards", "yes_delete"),
+        text=yes_text,
         callback_data=ConfirmationCallbackFactory(
             action=action,
             item_id=item_id,
@@ -23,7 +38,7 @@ def get_delete_confirmation_keyboard(
         ),
     )
     builder.button(
-        text=manager.get_message("keyboards", "no_go_back"),
+        text=no_text,
         callback_data=ConfirmationCallbackFactory(
             action=action,
             item_id=item_id,
@@ -33,10 +48,23 @@ def get_delete_confirmation_keyboard(
     return builder.as_markup()
 
 
+@lru_cache(maxsize=None)
+def static_button(text: str, callback_data: str) -> InlineKeyboardButton:
+    """
+    Returns one shared button per (label, callback) pair for the fixed
+    buttons of otherwise dynamic keyboards. Callers must not mutate it.
+    """
+    return InlineKeyboardButton(text=text, callback_data=callback_data)
+
+
 def get_cancel_keyboard() -> InlineKeyboardMarkup:
     """A simple keyboard with a single 'Cancel' button."""
+    return _build_cancel_keyboard(manager.get_message("keyboards", "cancel"))
+
+
+@lru_cache(maxsize=None)
+def _build_cancel_keyboard(cancel_text: str) -> InlineKeyboardMarkup:
+    # Nothing mutates a returned markup, so one instance per label is shared.
     builder = InlineKeyboardBuilder()
-    builder.button(
-        text=manager.get_message("keyboards", "cancel"), callback_data="cancel_fsm"
-    )
+    builder.button(text=cancel_text, callback_data="cancel_fsm")
     return builder.as_markup()
@@ -4,12 +4,18 @@ from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from ecombot.core.manager import central_manager as manager
+from ecombot.core.messages import render_template
 from ecombot.schemas.dto import OrderDTO
 
 from ..callback_data import CatalogCallbackFactory
 from ..callback_data import OrderCallbackFactory
 
 
+# Callback data of fixed buttons, packed once at import
+_CB_BACK_TO_MAIN = CatalogCallbackFactory(action="back_to_main", item_id=0).pack()
+_CB_BACK_TO_LIST = OrderCallbackFactory(action="back_to_list").pack()
+
+
 def get_orders_list_keyboard(orders: list[OrderDTO]) -> InlineKeyboardMarkup:
     """
     Builds a keyboard for the order history list, with a 'View Details'
@@ -20,19 +26,17 @@ def get_orders_list_keyboard(orders: list[OrderDTO]) -> InlineKeyboardMarkup:
     if not orders:
         builder.button(
             text=manager.get_message("keyboards", "go_to_catalog"),
-            callback_data=CatalogCallbackFactory(action="back_to_main", item_id=0),
+            callback_data=_CB_BACK_TO_MAIN,
         )
     else:
+        # Resolve the label template once for the whole list
+        label_template = manager.get_template("keyboards", "view_order_number")
         for order in orders:
             builder.button(
-                text=manager.get_message(
-                    "keyboards",
-                    "view_order_number",
-                    order_number=order.order_number,
-                ),
-                callback_data=OrderCallbackFactory(
-                    action="view_details", item_id=order.id
+                text=render_template(
+                    label_template, {"order_number": order.order_number}
                 ),
+                callback_data=OrderCallbackFactory.fast_pack("view_details", order.id),
             )
 
     builder.adjust(1)
@@ -44,6 +48,6 @@ def get_order_details_keyboard() -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(
         text=manager.get_message("keyboards", "back_to_orders"),
-        callback_data=OrderCallbackFactory(action="back_to_list"),
+        callback_data=_CB_BACK_TO_LIST,
     )
     return builder.as_markup()
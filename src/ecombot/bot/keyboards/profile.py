@@ -1,5 +1,7 @@
 """Profile-related keyboards."""
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
@@ -8,20 +10,35 @@ from ecombot.core.manager import central_manager as manager
 from ecombot.schemas.dto import DeliveryAddressDTO
 
 from ..callback_data import ProfileCallbackFactory
+from ..callback_data import pack_profile
+from .common import static_button
 
 
 def get_profile_keyboard() -> InlineKeyboardMarkup:
+    return _build_profile_keyboard(
+        manager.get_message("keyboards", "edit_phone"),
+        manager.get_message("keyboards", "edit_email"),
+        manager.get_message("keyboards", "manage_addresses"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_profile_keyboard(
+    edit_phone_text: str, edit_email_text: str, manage_addresses_text: str
+) -> InlineKeyboardMarkup:
+    # The layout is static; only the labels vary, by language. Nothing
+    # mutates a returned markup, so the built instance is shared.
     builder = InlineKeyboardBuilder()
     builder.button(
-        text=manager.get_message("keyboards", "edit_phone"),
+        text=edit_phone_text,
         callback_data=ProfileCallbackFactory(action="edit_phone"),
     )
     builder.button(
-        text=manager.get_message("keyboards", "edit_email"),
+        text=edit_email_text,
         callback_data=ProfileCallbackFactory(action="edit_email"),
     )
     builder.button(
-        text=manager.get_message("keyboards", "manage_addresses"),
+        text=manage_addresses_text,
         callback_data=ProfileCallbackFactory(action="manage_addr"),
     )
     builder.adjust(1)
@@ -30,9 +47,16 @@ def get_profile_keyboard() -> InlineKeyboardMarkup:
 
 def get_address_details_keyboard() -> InlineKeyboardMarkup:
     """Builds a keyboard for address details view."""
+    return _build_address_details_keyboard(
+        manager.get_message("keyboards", "back_to_addresses")
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_address_details_keyboard(back_text: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(
-        text=manager.get_message("keyboards", "back_to_addresses"),
+        text=back_text,
         callback_data=ProfileCallbackFactory(action="manage_addr"),
     )
     return builder.as_markup()
@@ -41,48 +65,58 @@ def get_address_details_keyboard() -> InlineKeyboardMarkup:
 def get_address_management_keyboard(
     addresses: list[DeliveryAddressDTO],
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    # One button per row throughout, so rows are assembled directly instead of
+    # going through InlineKeyboardBuilder's per-call bookkeeping.
+    get_message = manager.get_message
+    default_prefix = get_message("profile", "default_address_prefix")
+    address_prefix = get_message("profile", "address_prefix")
+    set_default_text = get_message("keyboards", "set_as_default")
+    delete_text = get_message("keyboards", "delete_address")
+
+    rows: list[list[InlineKeyboardButton]] = []
+    add_row = rows.append
     for addr in addresses:
         # Localized prefix using profile messages
-        prefix = (
-            manager.get_message("profile", "default_address_prefix")
-            if addr.is_default
-            else manager.get_message("profile", "address_prefix")
-        )
-
-        builder.row(
-            InlineKeyboardButton(
-                text=f"{prefix} {addr.address_label}",
-                callback_data=ProfileCallbackFactory(
-                    action="view_addr", address_id=addr.id
-                ).pack(),
-            )
+        prefix = default_prefix if addr.is_default else address_prefix
+        add_row(
+            [
+                InlineKeyboardButton(
+                    text=f"{prefix} {addr.address_label}",
+                    callback_data=pack_profile("view_addr", addr.id),
+                )
+            ]
         )
         if not addr.is_default:
-            builder.row(
+            add_row(
+                [
+                    InlineKeyboardButton(
+                        text=set_default_text,
+                        callback_data=pack_profile("set_default_addr", addr.id),
+                    )
+                ]
+            )
+        add_row(
+            [
                 InlineKeyboardButton(
-                    text=manager.get_message("keyboards", "set_as_default"),
-                    callback_data=ProfileCallbackFactory(
-                        action="set_default_addr", address_id=addr.id
-                    ).pack(),
+                    text=delete_text,
+                    callback_data=pack_profile("delete_addr", addr.id),
                 )
-            )
-        builder.row(
-            InlineKeyboardButton(
-                text=manager.get_message("keyboards", "delete_address"),
-                callback_data=ProfileCallbackFactory(
-                    action="delete_addr", address_id=addr.id
-                ).pack(),
-            )
+            ]
         )
 
-    builder.button(
-        text=manager.get_message("keyboards", "add_address"),
-        callback_data=ProfileCallbackFactory(action="add_addr"),
+    add_row(
+        [
+            static_button(
+                get_message("keyboards", "add_address"), pack_profile("add_addr")
+            )
+        ]
     )
-    builder.button(
-        text=manager.get_message("keyboards", "back_to_profile"),
-        callback_data=ProfileCallbackFactory(action="profile_back_main"),
+    add_row(
+        [
+            static_button(
+                get_message("keyboards", "back_to_profile"),
+                pack_profile("profile_back_main"),
+            )
+        ]
     )
-    builder.adjust(1)
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=rows)
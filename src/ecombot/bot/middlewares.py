@@ -6,7 +6,9 @@ This is the ideal place for tasks like managing database sessions, handling
 authorization, or collecting metrics.
 """
 
+import asyncio
 import contextlib
+import time
 from typing import Any
 from typing import Awaitable
 from typing import Callable
@@ -14,6 +16,12 @@ from typing import Dict
 
 from aiogram import BaseMiddleware
 from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
+from aiogram.client.session.middlewares.base import NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import TelegramType
 from aiogram.types import CallbackQuery
 from aiogram.types import Message
 from aiogram.types import TelegramObject
@@ -24,6 +32,7 @@ from ecombot.config import settings
 from ecombot.core.manager import central_manager as manager
 from ecombot.db import crud
 from ecombot.db.models import User
+from ecombot.logging_setup import log
 
 
 class DbSessionMiddleware(BaseMiddleware):
@@ -136,3 +145,56 @@ class UserMiddleware(BaseMiddleware):
             await bot.set_my_commands(
                 commands, scope={"type": "chat", "chat_id": user_id}
             )
+
+
+class FloodControlMiddleware(BaseRequestMiddleware):
+    """
+    This Bot API request middleware honours Telegram flood control. Outgoing
+    requests are paced to the global limit (bursts of up to ``rate_limit``
+    requests, then ``rate_limit`` per second), so a busy bot slows down
+    before Telegram starts rejecting. When a request is rejected with
+    RetryAfter anyway, every outgoing request waits until the deadline has
+    passed instead of hitting the limit again, and the rejected request is
+    retried a bounded number of times.
+    """
+
+    def __init__(self, max_retries: int = 3, rate_limit: int = 30) -> None:
+        self.max_retries = max_retries
+        self._retry_at = 0.0  # time.monotonic() deadline shared by all requests
+        # Virtual-scheduling bucket: _next_at is when the bucket drains empty
+        self._interval = 1.0 / rate_limit
+        self._burst = self._interval * (rate_limit - 1)
+        self._next_at = 0.0
+
+    def _reserve_slot(self) -> float:
+        """Reserve the next send slot and return how long to wait for it."""
+        now = time.monotonic()
+        next_at = max(self._next_at, now)
+        self._next_at = next_at + self._interval
+        return next_at - self._burst - now
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        attempt = 0
+        while True:
+            delay = max(self._retry_at - time.monotonic(), self._reserve_slot())
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                self._retry_at = max(self._retry_at, time.monotonic() + e.retry_after)
+                log.warning(
+                    "Flood control on {}, retrying in {}s (attempt {}/{})",
+                    type(method).__name__,
+                    e.retry_after,
+                    attempt,
+                    self.max_retries,
+                )
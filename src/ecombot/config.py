@@ -11,6 +11,7 @@ Attributes:
     settings (Settings): A singleton instance of the validated settings class.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
@@ -68,7 +69,14 @@ class Settings(DatabaseSettings):
         return v.strip() if v else v
 
     def get_zoneinfo(self) -> ZoneInfo:
-        return ZoneInfo(self.TIMEZONE)
+        return _load_zoneinfo(self.TIMEZONE)
+
+
+@lru_cache(maxsize=None)
+def _load_zoneinfo(key: str) -> ZoneInfo:
+    # Keyed on the zone name, so a changed TIMEZONE is picked up without
+    # any explicit invalidation.
+    return ZoneInfo(key)
 
 
 settings = Settings()
@@ -45,10 +45,30 @@ class CentralizedManager:
         self, category: str, key: str, language: Optional[Language] = None, **kwargs
     ) -> str:
         """Get message from specific category."""
+        manager = self.messages.get(category)
+        if manager is None:
+            return key
+        if kwargs:
+            return manager.get_message(key, language, **kwargs)
+        # Plain messages are the memoized templates themselves
+        return manager.get_template(key, language)
+
+    def get_template(
+        self, category: str, key: str, language: Optional[Language] = None
+    ) -> str:
+        """Get the raw (unformatted) message template from specific category."""
         if category in self.messages:
-            return self.messages[category].get_message(key, language, **kwargs)
+            return self.messages[category].get_template(key, language)
         return key
 
+    def get_templates(
+        self, category: str, keys: tuple[str, ...], language: Optional[Language] = None
+    ) -> tuple[str, ...]:
+        """Get the raw templates for several keys of one category, in order."""
+        if category in self.messages:
+            return self.messages[category].get_templates(keys, language)
+        return keys
+
     def get_commands(self, role: str = "user", language: Optional[Language] = None):
         """Get commands for role and language."""
         return self.commands.get_commands(role, language)
@@ -5,7 +5,10 @@ from abc import abstractmethod
 from enum import Enum
 from typing import Any
 from typing import Dict
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 
 class Language(Enum):
@@ -31,12 +34,22 @@ class MessageCategory(Enum):
     ERRORS = "errors"
 
 
+def render_template(template: str, values: Mapping[str, Any]) -> str:
+    """Format a template, returning it unformatted if the values don't fit."""
+    try:
+        return template.format_map(values)
+    except (KeyError, ValueError):
+        return template
+
+
 class BaseMessageManager(ABC):
     """Abstract base class for message management with i18n support."""
 
     def __init__(self, default_language: Language = Language.EN):
         self.default_language = default_language
         self._messages: Dict[Language, Dict[str, str]] = {}
+        self._template_cache: Dict[Union[str, Tuple[str, Language]], str] = {}
+        self._templates_cache: Dict[Any, Tuple[str, ...]] = {}
         self._load_messages()
 
     @abstractmethod
@@ -44,10 +57,21 @@ class BaseMessageManager(ABC):
         """Load messages for all supported languages."""
         pass
 
-    def get_message(
-        self, key: str, language: Optional[Language] = None, **kwargs: Any
-    ) -> str:
-        """Get localized message with optional formatting."""
+    def get_template(self, key: str, language: Optional[Language] = None) -> str:
+        """
+        Get the raw (unformatted) localized message template.
+
+        The language fallback chain is resolved once per (key, language) pair
+        and memoized, so hot paths can fetch a template before a loop and call
+        `.format()` on it directly.
+        """
+        # Default-language lookups (the common case) are keyed by the key
+        # alone: hashing a (key, Language) tuple runs Enum.__hash__ in Python.
+        cache_key = key if language is None else (key, language)
+        cached = self._template_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         lang = language or self.default_language
 
         # Fallback to default language if key not found
@@ -56,16 +80,38 @@ class BaseMessageManager(ABC):
 
         # Fallback to key if still not found
         if lang not in self._messages or key not in self._messages[lang]:
-            return key
+            template = key
+        else:
+            template = self._messages[lang][key]
+
+        self._template_cache[cache_key] = template
+        return template
+
+    def get_templates(
+        self, keys: Tuple[str, ...], language: Optional[Language] = None
+    ) -> Tuple[str, ...]:
+        """
+        Get the raw templates for several keys at once, in the given order.
+
+        The resolved tuple is memoized per (keys, language), so a builder that
+        needs a fixed set of labels pays one dict lookup instead of one per key.
+        """
+        cache_key = keys if language is None else (keys, language)
+        cached = self._templates_cache.get(cache_key)
+        if cached is None:
+            cached = tuple(self.get_template(key, language) for key in keys)
+            self._templates_cache[cache_key] = cached
+        return cached
 
-        message = self._messages[lang][key]
+    def get_message(
+        self, key: str, language: Optional[Language] = None, **kwargs: Any
+    ) -> str:
+        """Get localized message with optional formatting."""
+        message = self.get_template(key, language)
 
         # Format message with provided kwargs
         if kwargs:
-            try:
-                return message.format(**kwargs)
-            except (KeyError, ValueError):
-                return message
+            return render_template(message, kwargs)
 
         return message
 
@@ -74,6 +120,8 @@ class BaseMessageManager(ABC):
         if language not in self._messages:
             self._messages[language] = {}
         self._messages[language][key] = message
+        self._template_cache.clear()
+        self._templates_cache.clear()
 
     def get_supported_languages(self) -> list[Language]:
         """Get list of supported languages."""
@@ -29,6 +29,7 @@ from .catalog import restore_product
 from .catalog import soft_delete_category
 from .catalog import update_product
 from .catalog import update_product_image_telegram_id
+from .orders import count_orders_by_user_pk
 from .orders import create_order_with_items
 from .orders import get_order
 from .orders import get_orders_by_status
@@ -38,6 +39,7 @@ from .orders import update_order_status
 from .users import add_delivery_address
 from .users import delete_delivery_address
 from .users import get_or_create_user
+from .users import get_user_address
 from .users import get_user_addresses
 from .users import set_default_address
 from .users import update_user_profile
@@ -68,6 +70,7 @@ __all__ = [
     "update_product",
     "update_product_image_telegram_id",
     # Order functions
+    "count_orders_by_user_pk",
     "create_order_with_items",
     "get_order",
     "get_orders_by_status",
@@ -78,6 +81,7 @@ __all__ = [
     "add_delivery_address",
     "delete_delivery_address",
     "get_or_create_user",
+    "get_user_address",
     "get_user_addresses",
     "set_default_address",
     "update_user_profile",
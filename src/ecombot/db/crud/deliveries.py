@@ -20,6 +20,13 @@ async def get_all_pickup_points(session: AsyncSession) -> Sequence[PickupPoint]:
     return result.scalars().all()
 
 
+async def get_active_pickup_points(session: AsyncSession) -> Sequence[PickupPoint]:
+    """Retrieves all active pickup points."""
+    stmt = select(PickupPoint).where(PickupPoint.is_active)
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
 async def get_pickup_point(
     session: AsyncSession, pickup_point_id: int
 ) -> Optional[PickupPoint]:
@@ -75,6 +82,21 @@ async def get_all_delivery_options(session: AsyncSession) -> Sequence[DeliveryOp
     return result.scalars().all()
 
 
+async def has_active_courier_option(session: AsyncSession) -> bool:
+    """Checks whether any active delivery option is not a pickup type."""
+    pickup_types = [
+        DeliveryType.PICKUP_STORE,
+        DeliveryType.PICKUP_LOCKER,
+        DeliveryType.PICKUP_CURBSIDE,
+    ]
+    stmt = select(DeliveryOption).where(
+        DeliveryOption.is_active,
+        DeliveryOption.delivery_type.notin_(pickup_types),
+    )
+    result = await session.execute(stmt)
+    return bool(result.scalars().first())
+
+
 async def toggle_delivery_option(
     session: AsyncSession, delivery_type: DeliveryType
 ) -> DeliveryOption:
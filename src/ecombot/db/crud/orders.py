@@ -5,10 +5,12 @@ from typing import List
 from typing import Optional
 from typing import Sequence
 
+from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from ...logging_setup import log
 from ...schemas.enums import DeliveryType
@@ -26,6 +28,23 @@ class InsufficientStockError(Exception):
     pass
 
 
+def _order_load_options() -> tuple[LoaderOption, ...]:
+    """
+    Eager-loading options for everything OrderDTO touches.
+
+    Items and their products (including soft-deleted ones) are loaded with
+    batched SELECT ... IN queries, so the number of round trips stays fixed
+    regardless of how many items or orders are fetched.
+    """
+    return (
+        selectinload(Order.user),
+        selectinload(Order.items)
+        .selectinload(OrderItem.product)
+        .options(selectinload(Product.category), selectinload(Product.images)),
+        selectinload(Order.pickup_point),
+    )
+
+
 async def create_order_with_items(
     session: AsyncSession,
     user_id: int,
@@ -86,66 +105,40 @@ async def create_order_with_items(
 
 async def get_order(session: AsyncSession, order_id: int) -> Optional[Order]:
     """Fetches a single order by its ID, loading its items with products
-    (including deleted)."""
-    stmt = (
-        select(Order)
-        .where(Order.id == order_id)
-        .options(
-            selectinload(Order.user),
-            selectinload(Order.items),
-            selectinload(Order.pickup_point),
-        )
-    )
+    (including deleted) in a fixed number of queries."""
+    stmt = select(Order).where(Order.id == order_id).options(*_order_load_options())
     result = await session.execute(stmt)
-    order = result.scalars().first()
-
-    if order:
-        # Manually load products including deleted ones
-        for item in order.items:
-            product_stmt = (
-                select(Product)
-                .where(Product.id == item.product_id)
-                .options(selectinload(Product.category), selectinload(Product.images))
-            )
-            product_result = await session.execute(product_stmt)
-            item.product = product_result.scalars().first()
-
-    return order
+    return result.scalars().first()
 
 
 async def get_orders_by_user_pk(
     session: AsyncSession,
     user_id: int,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> Sequence[Order]:
     """
-    Fetches all of a user's orders by their user primary key,
+    Fetches a user's orders by their user primary key, newest first,
     eagerly loading all nested relationships needed for DTO conversion.
+    Pass `limit`/`offset` to fetch a single page instead of the full history.
     """
     stmt = (
         select(Order)
         .where(Order.user_id == user_id)
-        .options(
-            selectinload(Order.user),
-            selectinload(Order.items),
-            selectinload(Order.pickup_point),
-        )
-        .order_by(Order.created_at.desc())
+        .options(*_order_load_options())
+        .order_by(Order.created_at.desc(), Order.id.desc())
     )
+    if limit is not None:
+        stmt = stmt.limit(limit).offset(offset)
     result = await session.execute(stmt)
-    orders = result.scalars().all()
-
-    # Manually load products including deleted ones
-    for order in orders:
-        for item in order.items:
-            product_stmt = (
-                select(Product)
-                .where(Product.id == item.product_id)
-                .options(selectinload(Product.category), selectinload(Product.images))
-            )
-            product_result = await session.execute(product_stmt)
-            item.product = product_result.scalars().first()
+    return result.scalars().all()
 
-    return orders
+
+async def count_orders_by_user_pk(session: AsyncSession, user_id: int) -> int:
+    """Counts a user's orders without loading them."""
+    stmt = select(func.count()).select_from(Order).where(Order.user_id == user_id)
+    result = await session.execute(stmt)
+    return result.scalar_one()
 
 
 async def get_orders_by_status(
@@ -156,28 +149,11 @@ async def get_orders_by_status(
     stmt = (
         select(Order)
         .where(Order.status == status)
-        .options(
-            selectinload(Order.user),
-            selectinload(Order.items),
-            selectinload(Order.pickup_point),
-        )
+        .options(*_order_load_options())
         .order_by(Order.created_at.desc())
     )
     result = await session.execute(stmt)
-    orders = result.scalars().all()
-
-    # Manually load products including deleted ones
-    for order in orders:
-        for item in order.items:
-            product_stmt = (
-                select(Product)
-                .where(Product.id == item.product_id)
-                .options(selectinload(Product.category), selectinload(Product.images))
-            )
-            product_result = await session.execute(product_stmt)
-            item.product = product_result.scalars().first()
-
-    return orders
+    return result.scalars().all()
 
 
 async def update_order_status(
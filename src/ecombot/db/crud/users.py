@@ -26,7 +26,7 @@ async def get_or_create_user(
     stmt = (
         select(User)
         .where(User.telegram_id == telegram_user.id)
-        .options(selectinload(User.addresses))
+        .options(selectinload(User.default_address))
     )
     result = await session.execute(stmt)
     db_user = result.scalars().first()
@@ -39,7 +39,7 @@ async def get_or_create_user(
         )
         session.add(db_user)
         await session.flush()
-        await session.refresh(db_user, attribute_names=["addresses"])
+        await session.refresh(db_user, attribute_names=["default_address"])
 
     return db_user
 
@@ -52,17 +52,20 @@ async def update_user_profile(
     """Updates a user's profile details (phone, email)."""
     allowed_fields = {"phone", "email", "first_name"}
 
-    user = await session.get(User, user_id)
-    if user:
-        for key, value in update_data.items():
-            if key in allowed_fields:
-                setattr(user, key, value)
-            else:
-                log.warning(
-                    f"Attempt to update invalid field '{key}' for user {user_id}"
-                )
-        await session.flush()
-    return user
+    values = {}
+    for key, value in update_data.items():
+        if key in allowed_fields:
+            values[key] = value
+        else:
+            log.warning(f"Attempt to update invalid field '{key}' for user {user_id}")
+    if not values:
+        return await session.get(User, user_id)
+
+    # RETURNING hands back the updated row (synced into the identity map),
+    # so no SELECT is needed before or after the write.
+    stmt = update(User).where(User.id == user_id).values(**values).returning(User)
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
 
 
 async def get_user_addresses(
@@ -79,6 +82,19 @@ async def get_user_addresses(
     return list(result.scalars().all())
 
 
+async def get_user_address(
+    session: AsyncSession,
+    user_id: int,
+    address_id: int,
+) -> Optional[DeliveryAddress]:
+    """Fetches a single delivery address, scoped to its owner."""
+    stmt = select(DeliveryAddress).where(
+        DeliveryAddress.id == address_id, DeliveryAddress.user_id == user_id
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
 async def add_delivery_address(
     session: AsyncSession,
     user_id: int,
@@ -106,12 +122,7 @@ async def delete_delivery_address(
     """
     from sqlalchemy import delete
 
-    # First check if address exists and belongs to user
-    address = await session.get(DeliveryAddress, address_id)
-    if not address or address.user_id != user_id:
-        return False
-
-    # Delete using direct SQL
+    # The user filter doubles as the ownership check, so no prior SELECT
     delete_stmt = delete(DeliveryAddress).where(
         DeliveryAddress.id == address_id, DeliveryAddress.user_id == user_id
     )
@@ -125,18 +136,17 @@ async def set_default_address(
     session: AsyncSession, user_id: int, address_id: int
 ) -> Optional[DeliveryAddress]:
     """Sets a specific address as the default for the user."""
-    # Step 1: Set all the user's other addresses to is_default = False
+    # Step 1: Make sure the target address exists and belongs to the user
+    address_to_set = await session.get(DeliveryAddress, address_id)
+    if not address_to_set or address_to_set.user_id != user_id:
+        return None
+
+    # Step 2: Flip the flag on all of the user's addresses in one statement
     update_stmt = (
         update(DeliveryAddress)
-        .where(DeliveryAddress.user_id == user_id, DeliveryAddress.id != address_id)
-        .values(is_default=False)
+        .where(DeliveryAddress.user_id == user_id)
+        .values(is_default=DeliveryAddress.id == address_id)
     )
     await session.execute(update_stmt)
-
-    # Step 2: Get the target address and set it as the default
-    address_to_set = await session.get(DeliveryAddress, address_id)
-    if address_to_set and address_to_set.user_id == user_id:
-        address_to_set.is_default = True
-        await session.flush()
-        return address_to_set
-    return None
+    address_to_set.is_default = True
+    return address_to_set
@@ -61,6 +61,14 @@ class User(Base, TimestampMixin):
     email: Mapped[str | None] = mapped_column(String(255))
 
     addresses: Mapped[list["DeliveryAddress"]] = relationship(back_populates="user")
+    default_address: Mapped["DeliveryAddress | None"] = relationship(
+        primaryjoin=(
+            "and_(User.id == DeliveryAddress.user_id, "
+            "DeliveryAddress.is_default.is_(True))"
+        ),
+        viewonly=True,
+        uselist=False,
+    )
     orders: Mapped[list["Order"]] = relationship(back_populates="user")
 
 
@@ -116,7 +124,7 @@ class PickupPoint(Base, TimestampMixin):
     working_hours: Mapped[str | None] = mapped_column(String(255))
     latitude: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
     longitude: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
 
 
 class Category(Base, TimestampMixin, SoftDeleteMixin):
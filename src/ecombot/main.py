@@ -11,6 +11,7 @@ from ecombot.bot.handlers import checkout
 from ecombot.bot.handlers import orders
 from ecombot.bot.handlers import profile
 from ecombot.bot.middlewares import DbSessionMiddleware
+from ecombot.bot.middlewares import FloodControlMiddleware
 from ecombot.bot.middlewares import UserMiddleware
 from ecombot.config import settings
 from ecombot.db.database import AsyncSessionLocal
@@ -21,6 +22,7 @@ bot = Bot(
     token=settings.BOT_TOKEN,
     default=DefaultBotProperties(parse_mode="HTML"),
 )
+bot.session.middleware(FloodControlMiddleware())
 dp = Dispatcher()
 
 dp.update.middleware(DbSessionMiddleware(session_pool=AsyncSessionLocal))
@@ -110,6 +110,11 @@ class OrderItemDTO(BaseDTO):
     price: Decimal
     product: ProductDTO
 
+    @property
+    def total(self) -> Decimal:
+        """Line total for this item (unit price at purchase times quantity)."""
+        return self.price * self.quantity
+
 
 class UserSimpleDTO(BaseDTO):
     telegram_id: int
@@ -150,6 +155,20 @@ class OrderDTO(BaseDTO):
         )
         return items_total + self.delivery_fee
 
+    @property
+    def item_totals(self) -> tuple[Decimal, Decimal]:
+        """
+        Splits the items total into (active, deleted) sums, where deleted
+        covers products that have since been soft-deleted from the catalog.
+        """
+        active_total = deleted_total = Decimal("0.00")
+        for item in self.items:
+            if item.product.deleted_at is None:
+                active_total += item.total
+            else:
+                deleted_total += item.total
+        return active_total, deleted_total
+
     @property
     def display_order_number(self) -> str:
         """
@@ -190,7 +209,7 @@ class UserProfileDTO(BaseDTO):
     first_name: str
     phone: str | None
     email: str | None
-    addresses: list[DeliveryAddressDTO]
+    default_address: DeliveryAddressDTO | None = None
 
 
 class DeliveryOptionDTO(BaseDTO):
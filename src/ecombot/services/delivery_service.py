@@ -0,0 +1,100 @@
+"""
+Service layer for delivery availability lookups used during checkout.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ecombot.config import settings
+from ecombot.db.crud import deliveries as deliveries_crud
+from ecombot.schemas.dto import PickupPointDTO
+
+
+# Delivery configuration changes rarely, so checkout entry points reuse the
+# last lookup for a short while instead of querying on every button press.
+DELIVERY_CACHE_TTL = 30.0
+
+_courier_cache: Optional[tuple[float, bool]] = None
+_pickup_points_cache: Optional[tuple[float, tuple[PickupPointDTO, ...]]] = None
+_delivery_cache_lock = asyncio.Lock()
+
+
+def reset_delivery_cache() -> None:
+    """Drops cached delivery lookups."""
+    global _courier_cache, _pickup_points_cache
+    _courier_cache = None
+    _pickup_points_cache = None
+
+
+def _reset_delivery_cache_listener(_session: Session) -> None:
+    reset_delivery_cache()
+
+
+def reset_delivery_cache_on_commit(session: AsyncSession) -> None:
+    """
+    Drops cached delivery lookups once the session's transaction commits.
+
+    Call after any admin delivery change. Resetting earlier would let a
+    concurrent checkout re-cache the old committed rows for a full TTL.
+    """
+    event.listen(
+        session.sync_session,
+        "after_commit",
+        _reset_delivery_cache_listener,
+        once=True,
+    )
+
+
+async def check_courier_availability(session: AsyncSession) -> bool:
+    """
+    Checks if courier delivery is available.
+    Returns True if global DELIVERY is True AND there is at least one active
+    DeliveryOption that is NOT a pickup type.
+    """
+    global _courier_cache
+
+    if not settings.DELIVERY:
+        return False
+
+    cached = _courier_cache
+    if cached is not None and time.monotonic() - cached[0] < DELIVERY_CACHE_TTL:
+        return cached[1]
+
+    async with _delivery_cache_lock:
+        # Another request may have refreshed the cache while we waited
+        cached = _courier_cache
+        if cached is not None and time.monotonic() - cached[0] < DELIVERY_CACHE_TTL:
+            return cached[1]
+
+        available = await deliveries_crud.has_active_courier_option(session)
+        _courier_cache = (time.monotonic(), available)
+
+    return available
+
+
+async def get_active_pickup_points(session: AsyncSession) -> list[PickupPointDTO]:
+    """Returns a list of all active pickup points."""
+    global _pickup_points_cache
+
+    # The cache holds a tuple so callers only ever get their own list copy
+    cached = _pickup_points_cache
+    if cached is not None and time.monotonic() - cached[0] < DELIVERY_CACHE_TTL:
+        return list(cached[1])
+
+    async with _delivery_cache_lock:
+        cached = _pickup_points_cache
+        if cached is not None and time.monotonic() - cached[0] < DELIVERY_CACHE_TTL:
+            return list(cached[1])
+
+        points = tuple(
+            PickupPointDTO.model_validate(pp)
+            for pp in await deliveries_crud.get_active_pickup_points(session)
+        )
+        _pickup_points_cache = (time.monotonic(), points)
+
+    return list(points)
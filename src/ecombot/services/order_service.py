@@ -267,6 +267,21 @@ async def list_user_orders(session: AsyncSession, user_id: int) -> List[OrderDTO
     return [OrderDTO.model_validate(order) for order in db_orders]
 
 
+async def list_user_orders_page(
+    session: AsyncSession, user_id: int, limit: int, offset: int
+) -> List[OrderDTO]:
+    """Fetches a single page of a user's orders, newest first."""
+    db_orders = await crud.get_orders_by_user_pk(
+        session, user_id, limit=limit, offset=offset
+    )
+    return [OrderDTO.model_validate(order) for order in db_orders]
+
+
+async def count_user_orders(session: AsyncSession, user_id: int) -> int:
+    """Returns the total number of orders placed by a user."""
+    return await crud.count_orders_by_user_pk(session, user_id)
+
+
 async def get_orders_by_status_for_admin(
     session: AsyncSession, status: OrderStatus
 ) -> List[OrderDTO]:
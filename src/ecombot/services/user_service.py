@@ -6,6 +6,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ecombot.db import crud
@@ -27,8 +28,18 @@ class UserNotFoundError(Exception):
     pass
 
 
+async def _ensure_default_address_loaded(session: AsyncSession, user: User) -> None:
+    """
+    The user middleware eager-loads default_address; reload just that row
+    if a later refresh of the user has expired it.
+    """
+    if "default_address" in inspect(user).unloaded:
+        await session.refresh(user, attribute_names=["default_address"])
+
+
 async def get_user_profile(session: AsyncSession, db_user: User) -> UserProfileDTO:
     """Fetches and converts a user's profile to a DTO."""
+    await _ensure_default_address_loaded(session, db_user)
     return UserProfileDTO.model_validate(db_user)
 
 
@@ -39,6 +50,7 @@ async def update_profile_details(
     user = await crud.update_user_profile(session, user_id, update_data)
     if not user:
         raise UserNotFoundError("User not found during update.")
+    await _ensure_default_address_loaded(session, user)
     return UserProfileDTO.model_validate(user)
 
 
@@ -50,6 +62,16 @@ async def get_all_user_addresses(
     return [DeliveryAddressDTO.model_validate(addr) for addr in addresses]
 
 
+async def get_user_address(
+    session: AsyncSession, user_id: int, address_id: int
+) -> DeliveryAddressDTO:
+    """Fetches one of a user's delivery addresses."""
+    address = await crud.get_user_address(session, user_id, address_id)
+    if not address:
+        raise AddressNotFoundError("Address not found or permission denied.")
+    return DeliveryAddressDTO.model_validate(address)
+
+
 async def add_new_address(
     session: AsyncSession, user_id: int, label: str, address: str
 ) -> DeliveryAddress:
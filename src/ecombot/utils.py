@@ -4,6 +4,7 @@ General utility functions for the application.
 
 import asyncio
 import datetime
+from functools import lru_cache
 from pathlib import Path
 import secrets
 import string
@@ -32,6 +33,22 @@ def generate_order_number() -> str:
     return f"{date_part}-{time_part}-{random_part}"
 
 
+def format_datetime(value: datetime.datetime, fmt: str) -> str:
+    """
+    Formats a datetime with strftime, memoizing the result.
+    Aware datetimes for the same instant compare equal across time zones,
+    so the zone is part of the cache key.
+    """
+    return _format_datetime(value, value.tzinfo, fmt)
+
+
+@lru_cache(maxsize=1024)
+def _format_datetime(
+    value: datetime.datetime, tzinfo: datetime.tzinfo | None, fmt: str
+) -> str:
+    return value.strftime(fmt)
+
+
 def compress_image_sync(
     file_path: str, quality: int = 85, max_size: tuple[int, int] = (1280, 1280)
 ) -> None:
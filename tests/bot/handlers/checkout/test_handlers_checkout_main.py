@@ -89,7 +89,7 @@ async def test_checkout_start_handler_fast_path(
 ):
     """Test fast path checkout (user has phone and default address)."""
     mocker.patch(
-        "ecombot.bot.handlers.checkout.main.check_courier_availability",
+        "ecombot.bot.handlers.checkout.main.delivery_service.check_courier_availability",
         return_value=True,
         new_callable=AsyncMock,
     )
@@ -116,8 +116,7 @@ async def test_checkout_start_handler_fast_path(
         query, mock_session, db_user, state, callback_message
     )
 
-    state.update_data.assert_any_call(is_pickup=False)
-    state.update_data.assert_any_call(default_address_id=1)
+    state.update_data.assert_awaited_once_with(is_pickup=False, default_address_id=1)
     callback_message.answer.assert_awaited_once()
     state.set_state.assert_awaited_once_with(CheckoutFSM.confirm_fast_path)
 
@@ -95,7 +95,7 @@ async def test_get_phone_handler_text(
 ):
     """Test receiving phone as text."""
     mocker.patch(
-        "ecombot.bot.handlers.checkout.slow_path.check_courier_availability",
+        "ecombot.bot.handlers.checkout.slow_path.delivery_service.check_courier_availability",
         return_value=True,
         new_callable=AsyncMock,
     )
@@ -107,8 +107,7 @@ async def test_get_phone_handler_text(
 
     await slow_path.get_phone_handler(message, mock_session, state, db_user)
 
-    state.update_data.assert_any_call(phone="1234567890")
-    state.update_data.assert_any_call(is_pickup=False)
+    state.update_data.assert_awaited_once_with(phone="1234567890", is_pickup=False)
     message.answer.assert_awaited_once()
     state.set_state.assert_awaited_once_with(CheckoutFSM.getting_address)
 
@@ -118,7 +117,7 @@ async def test_get_phone_handler_contact(
 ):
     """Test receiving phone as contact."""
     mocker.patch(
-        "ecombot.bot.handlers.checkout.slow_path.check_courier_availability",
+        "ecombot.bot.handlers.checkout.slow_path.delivery_service.check_courier_availability",
         return_value=True,
         new_callable=AsyncMock,
     )
@@ -132,12 +131,48 @@ async def test_get_phone_handler_contact(
 
     await slow_path.get_phone_handler(message, mock_session, state, db_user)
 
-    state.update_data.assert_any_call(phone="9876543210")
-    state.update_data.assert_any_call(is_pickup=False)
+    state.update_data.assert_awaited_once_with(phone="9876543210", is_pickup=False)
     message.answer.assert_awaited_once()
     state.set_state.assert_awaited_once_with(CheckoutFSM.getting_address)
 
 
+async def test_get_phone_handler_single_pickup_point(
+    mock_manager, mock_cart_service, mock_utils, mock_keyboards, mock_session, mocker
+):
+    """Test that the single pickup point path writes FSM data in one call."""
+    mocker.patch(
+        "ecombot.bot.handlers.checkout.slow_path.delivery_service.check_courier_availability",
+        return_value=False,
+        new_callable=AsyncMock,
+    )
+    pickup_point = MagicMock(id=5, address="Main St 1")
+    pickup_point.name = "Store"
+    mocker.patch(
+        "ecombot.bot.handlers.checkout.slow_path.delivery_service.get_active_pickup_points",
+        return_value=[pickup_point],
+        new_callable=AsyncMock,
+    )
+    message = AsyncMock()
+    message.text = " 555 "
+    message.contact = None
+    state = AsyncMock(spec=FSMContext)
+    db_user = MagicMock(spec=User)
+    db_user.telegram_id = 123
+    mock_cart_service.get_user_cart = AsyncMock(return_value=MagicMock())
+
+    await slow_path.get_phone_handler(message, mock_session, state, db_user)
+
+    state.update_data.assert_awaited_once_with(
+        phone="555",
+        is_pickup=True,
+        pickup_point_id=5,
+        pickup_point_name="Store (Main St 1)",
+        address="Store (Main St 1)",
+    )
+    state.get_data.assert_not_awaited()
+    state.set_state.assert_awaited_once_with(CheckoutFSM.confirm_slow_path)
+
+
 async def test_get_phone_handler_invalid(mock_manager, mock_session):
     """Test receiving invalid phone input."""
     message = AsyncMock()
@@ -163,12 +198,17 @@ async def test_get_address_handler_success(
     db_user = MagicMock(spec=User)
     db_user.telegram_id = 123
 
-    state.get_data.return_value = {"name": "John", "phone": "123"}
+    user_data = {"name": "John", "phone": "123", "address": "123 Main St"}
+    state.update_data.return_value = user_data
     mock_cart_service.get_user_cart = AsyncMock(return_value=MagicMock())
 
     await slow_path.get_address_handler(message, mock_session, state, db_user)
 
     state.update_data.assert_awaited_once_with(address="123 Main St")
+    state.get_data.assert_not_awaited()
+    mock_utils.assert_called_once_with(
+        user_data, mock_cart_service.get_user_cart.return_value, is_pickup=False
+    )
     mock_cart_service.get_user_cart.assert_awaited_once_with(mock_session, 123)
     message.answer.assert_awaited_once()
     state.set_state.assert_awaited_once_with(CheckoutFSM.confirm_slow_path)
@@ -56,34 +56,24 @@ def mock_manager(mocker: MockerFixture):
 
 
 def test_get_default_address_found():
-    """Test finding the default address."""
-    addr1 = MagicMock(spec=DeliveryAddress, is_default=False)
-    addr2 = MagicMock(spec=DeliveryAddress, is_default=True)
-    user = MagicMock(spec=User, addresses=[addr1, addr2])
+    """Test returning the eagerly loaded default address."""
+    addr = MagicMock(spec=DeliveryAddress, is_default=True)
+    user = MagicMock(spec=User, default_address=addr)
 
     result = utils.get_default_address(user)
-    assert result == addr2
+    assert result == addr
 
 
 def test_get_default_address_none_found():
     """Test when no address is marked default."""
-    addr1 = MagicMock(spec=DeliveryAddress, is_default=False)
-    user = MagicMock(spec=User, addresses=[addr1])
+    user = MagicMock(spec=User, default_address=None)
 
     result = utils.get_default_address(user)
     assert result is None
 
 
-def test_get_default_address_no_addresses():
-    """Test when user has no addresses."""
-    user = MagicMock(spec=User, addresses=[])
-    result = utils.get_default_address(user)
-    assert result is None
-
-
-def test_determine_missing_info_none(mock_manager, mocker):
+def test_determine_missing_info_none(mock_manager):
     """Test when all info is present."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", True)
     user = MagicMock(spec=User, phone="123")
     address = MagicMock(spec=DeliveryAddress)
 
@@ -91,9 +81,8 @@ def test_determine_missing_info_none(mock_manager, mocker):
     assert result == []
 
 
-def test_determine_missing_info_phone(mock_manager, mocker):
+def test_determine_missing_info_phone(mock_manager):
     """Test when phone is missing."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", True)
     user = MagicMock(spec=User, phone=None)
     address = MagicMock(spec=DeliveryAddress)
 
@@ -102,9 +91,8 @@ def test_determine_missing_info_phone(mock_manager, mocker):
     assert "[missing_address]" not in result
 
 
-def test_determine_missing_info_address(mock_manager, mocker):
+def test_determine_missing_info_address(mock_manager):
     """Test when address is missing."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", True)
     user = MagicMock(spec=User, phone="123")
 
     result = utils.determine_missing_info(user, None, courier_available=True)
@@ -112,9 +100,8 @@ def test_determine_missing_info_address(mock_manager, mocker):
     assert "[missing_phone]" not in result
 
 
-def test_determine_missing_info_both(mock_manager, mocker):
+def test_determine_missing_info_both(mock_manager):
     """Test when both are missing."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", True)
     user = MagicMock(spec=User, phone=None)
 
     result = utils.determine_missing_info(user, None, courier_available=True)
@@ -122,9 +109,8 @@ def test_determine_missing_info_both(mock_manager, mocker):
     assert "[missing_address]" in result
 
 
-def test_determine_missing_info_no_delivery(mock_manager, mocker):
+def test_determine_missing_info_no_delivery(mock_manager):
     """Test when delivery is disabled (address should not be missing)."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", False)
     user = MagicMock(spec=User, phone="123")
 
     result = utils.determine_missing_info(user, None)
@@ -132,9 +118,8 @@ def test_determine_missing_info_no_delivery(mock_manager, mocker):
     assert result == []
 
 
-def test_generate_fast_path_confirmation_text(mock_manager, mocker):
+def test_generate_fast_path_confirmation_text(mock_manager):
     """Test text generation for fast path."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", True)
     user = MagicMock(spec=User, phone="555-1234")
     address = MagicMock(spec=DeliveryAddress, full_address="123 Main St")
     cart = MagicMock(spec=CartDTO, total_price=100.50)
@@ -147,9 +132,8 @@ def test_generate_fast_path_confirmation_text(mock_manager, mocker):
     assert "$" in text  # Currency symbol
 
 
-def test_generate_fast_path_confirmation_text_pickup(mock_manager, mocker):
+def test_generate_fast_path_confirmation_text_pickup(mock_manager):
     """Test text generation for fast path with pickup (no delivery)."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", False)
     user = MagicMock(spec=User, phone="555-1234")
     cart = MagicMock(spec=CartDTO, total_price=100.50)
 
@@ -160,9 +144,8 @@ def test_generate_fast_path_confirmation_text_pickup(mock_manager, mocker):
     assert "$" in text
 
 
-def test_generate_slow_path_confirmation_text(mock_manager, mocker):
+def test_generate_slow_path_confirmation_text(mock_manager):
     """Test text generation for slow path."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", True)
     user_data = {"name": "John Doe", "phone": "555-9876", "address": "456 Elm St"}
     cart = MagicMock(spec=CartDTO, total_price=50.00)
 
@@ -173,9 +156,8 @@ def test_generate_slow_path_confirmation_text(mock_manager, mocker):
     assert "$" in text
 
 
-def test_generate_slow_path_confirmation_text_pickup(mock_manager, mocker):
+def test_generate_slow_path_confirmation_text_pickup(mock_manager):
     """Test text generation for slow path with pickup."""
-    mocker.patch("ecombot.bot.handlers.checkout.utils.settings.DELIVERY", False)
     user_data = {"name": "John Doe", "phone": "555-9876"}
     cart = MagicMock(spec=CartDTO, total_price=50.00)
 
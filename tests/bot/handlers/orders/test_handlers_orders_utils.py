@@ -8,6 +8,7 @@ This module verifies:
 """
 
 from datetime import datetime
+from decimal import Decimal
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
@@ -16,7 +17,12 @@ import pytest
 from pytest_mock import MockerFixture
 
 import ecombot.bot.handlers.orders.utils as utils
+from ecombot.schemas.dto import CategoryDTO
 from ecombot.schemas.dto import OrderDTO
+from ecombot.schemas.dto import OrderItemDTO
+from ecombot.schemas.dto import ProductDTO
+from ecombot.schemas.dto import UserSimpleDTO
+from ecombot.schemas.enums import DeliveryType
 from ecombot.schemas.enums import OrderStatus
 
 
@@ -35,7 +41,13 @@ def mock_manager(mocker: MockerFixture):
             return f"[{key} {kwargs.get('name')}]"
         return f"[{key}]"
 
+    def template_side_effect(section, key):
+        if key == "order_item_template":
+            return f"[{key} {{name}}]"
+        return f"[{key}]"
+
     manager.get_message.side_effect = side_effect
+    manager.get_template.side_effect = template_side_effect
     return manager
 
 
@@ -73,7 +85,9 @@ def test_format_order_details_text_standard(mock_manager):
     item.product.deleted_at = None
     item.quantity = 2
     item.price = 10.0
+    item.total = 20.0
     order.items = [item]
+    order.item_totals = (20.0, 0.0)
 
     text = utils.format_order_details_text(order)
 
@@ -101,6 +115,7 @@ def test_format_order_details_text_deleted_items(mock_manager):
     item1.product.deleted_at = None
     item1.quantity = 1
     item1.price = 10.0
+    item1.total = 10.0
 
     # Deleted item
     item2 = MagicMock()
@@ -108,8 +123,10 @@ def test_format_order_details_text_deleted_items(mock_manager):
     item2.product.deleted_at = datetime.now()
     item2.quantity = 1
     item2.price = 20.0
+    item2.total = 20.0
 
     order.items = [item1, item2]
+    order.item_totals = (10.0, 20.0)
 
     text = utils.format_order_details_text(order)
 
@@ -120,17 +137,93 @@ def test_format_order_details_text_deleted_items(mock_manager):
     assert "[total_paid]" in text
 
 
+def test_format_order_details_text_item_template_fallback(mock_manager):
+    """Test a template with an unknown placeholder is rendered unformatted."""
+    mock_manager.get_template.side_effect = lambda section, key: "[{unknown}]"
+    order = MagicMock(spec=OrderDTO)
+    order.status = OrderStatus.PAID
+    order.created_at = datetime(2023, 1, 1)
+    order.shipping_address = "123 Main St"
+
+    item = MagicMock()
+    item.product.name = "Product A"
+    item.product.deleted_at = None
+    order.items = [item]
+    order.item_totals = (20.0, 0.0)
+
+    text = utils.format_order_details_text(order)
+
+    assert "[{unknown}]" in text
+
+
+def test_format_order_details_text_uses_dto_totals(mock_manager):
+    """Test that totals come from the DTO, split by soft-deleted products."""
+    category = CategoryDTO(id=1, name="Cat")
+    order = OrderDTO(
+        id=1,
+        user=UserSimpleDTO(telegram_id=1, first_name="John"),
+        order_number="ORD-123456-ABC",
+        status=OrderStatus.PAID,
+        contact_name="John",
+        phone="555",
+        address="123 Main St",
+        delivery_type=DeliveryType.PICKUP_STORE,
+        delivery_fee=Decimal("0.00"),
+        items=[
+            OrderItemDTO(
+                quantity=2,
+                price=Decimal("1.10"),
+                product=ProductDTO(
+                    id=1,
+                    name="P1",
+                    description="",
+                    price=Decimal("1.10"),
+                    category=category,
+                ),
+            ),
+            OrderItemDTO(
+                quantity=1,
+                price=Decimal("5.00"),
+                product=ProductDTO(
+                    id=2,
+                    name="P2",
+                    description="",
+                    price=Decimal("5.00"),
+                    category=category,
+                    deleted_at=datetime(2024, 1, 1),
+                ),
+            ),
+        ],
+        created_at=datetime(2023, 1, 1),
+    )
+
+    assert order.item_totals == (Decimal("2.20"), Decimal("5.00"))
+
+    utils.format_order_details_text(order)
+
+    totals = {
+        c.args[1]: c.kwargs["total"]
+        for c in mock_manager.get_message.call_args_list
+        if "total" in c.kwargs
+    }
+    assert totals["active_items_total"] == Decimal("2.20")
+    assert totals["deleted_items_total"] == Decimal("5.00")
+    assert totals["total_paid"] == Decimal("2.20")
+
+
 async def test_send_orders_view_empty(mock_manager, mock_order_service, mock_session):
     """Test sending view when user has no orders."""
     message = AsyncMock()
     db_user = MagicMock()
     db_user.id = 1
 
-    mock_order_service.list_user_orders = AsyncMock(return_value=[])
+    mock_order_service.count_user_orders = AsyncMock(return_value=0)
+    mock_order_service.list_user_orders_page = AsyncMock()
 
     await utils.send_orders_view(message, mock_session, db_user)
 
     message.answer.assert_awaited_once()
+    mock_order_service.list_user_orders_page.assert_not_awaited()
     # Should contain no orders message (checked via format_order_list_text logic)
     args, _ = message.answer.call_args
     assert "[no_orders_message]" in args[0]
@@ -149,12 +242,73 @@ async def test_send_orders_view_populated(
     order.status = OrderStatus.PAID
     order.total_price = 100.0
 
-    mock_order_service.list_user_orders = AsyncMock(return_value=[order])
+    mock_order_service.count_user_orders = AsyncMock(return_value=1)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=[order])
 
     await utils.send_orders_view(message, mock_session, db_user)
 
     message.edit_text.assert_awaited_once()
     message.answer.assert_not_awaited()
+    mock_order_service.list_user_orders_page.assert_awaited_once_with(
+        mock_session, 1, limit=5, offset=0
+    )
+
+
+async def test_send_orders_view_fetches_requested_page_only(
+    mock_manager, mock_order_service, mock_session
+):
+    """Test that only the requested page is loaded, clamped to the last page."""
+    message = AsyncMock()
+    db_user = MagicMock()
+    db_user.id = 1
+
+    order = MagicMock(spec=OrderDTO)
+    order.id = 10
+    order.status = OrderStatus.PAID
+    order.total_price = 100.0
+
+    mock_order_service.count_user_orders = AsyncMock(return_value=12)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=[order])
+
+    await utils.send_orders_view(message, mock_session, db_user, page=7)
+
+    mock_order_service.list_user_orders_page.assert_awaited_once_with(
+        mock_session, 1, limit=5, offset=10
+    )
+
+
+async def test_send_orders_view_status_labels_resolved_once(
+    mock_manager, mock_order_service, mock_session
+):
+    """Test that a status label shared by several orders is looked up once."""
+    message = AsyncMock()
+    db_user = MagicMock()
+    db_user.id = 1
+
+    orders = []
+    for order_id, status in enumerate(
+        [OrderStatus.PAID, OrderStatus.PAID, OrderStatus.SHIPPED], start=1
+    ):
+        order = MagicMock(spec=OrderDTO)
+        order.id = order_id
+        order.status = status
+        order.total_price = 10.0
+        orders.append(order)
+
+    mock_order_service.count_user_orders = AsyncMock(return_value=3)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=orders)
+
+    await utils.send_orders_view(message, mock_session, db_user)
+
+    status_lookups = [
+        c.args[1]
+        for c in mock_manager.get_message.call_args_list
+        if c.args[0] == "common"
+    ]
+    assert status_lookups == [
+        OrderStatus.PAID.message_key,
+        OrderStatus.SHIPPED.message_key,
+    ]
 
 
 async def test_send_orders_view_fallback(
@@ -169,7 +323,8 @@ async def test_send_orders_view_fallback(
     order.status = OrderStatus.PAID
     order.total_price = 100.0
 
-    mock_order_service.list_user_orders = AsyncMock(return_value=[order])
+    mock_order_service.count_user_orders = AsyncMock(return_value=1)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=[order])
 
     # Simulate BadRequest on edit
     message.edit_text.side_effect = TelegramBadRequest(method="edit", message="Error")
@@ -179,3 +334,114 @@ async def test_send_orders_view_fallback(
     message.edit_text.assert_awaited_once()
     message.delete.assert_awaited_once()
     message.answer.assert_awaited_once()
+
+
+async def test_send_orders_view_unchanged_skips_edit(
+    mock_manager, mock_order_service, mock_session
+):
+    """Test that re-rendering the content already on screen makes no API call."""
+    message = AsyncMock()
+    db_user = MagicMock()
+
+    order = MagicMock(spec=OrderDTO)
+    order.id = 10
+    order.status = OrderStatus.PAID
+    order.total_price = 100.0
+
+    mock_order_service.count_user_orders = AsyncMock(return_value=1)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=[order])
+
+    await utils.send_orders_view(message, mock_session, db_user)
+    text, keyboard = (
+        message.edit_text.call_args.args[0],
+        message.edit_text.call_args.kwargs["reply_markup"],
+    )
+    message.reset_mock()
+    message.html_text = text
+    message.reply_markup = keyboard
+
+    await utils.send_orders_view(message, mock_session, db_user)
+
+    message.edit_text.assert_not_awaited()
+    message.delete.assert_not_awaited()
+    message.answer.assert_not_awaited()
+
+
+async def test_send_orders_view_not_modified(
+    mock_manager, mock_order_service, mock_session
+):
+    """Test that a 'message is not modified' error does not trigger a resend."""
+    message = AsyncMock()
+    db_user = MagicMock()
+
+    order = MagicMock(spec=OrderDTO)
+    order.id = 10
+    order.status = OrderStatus.PAID
+    order.total_price = 100.0
+
+    mock_order_service.count_user_orders = AsyncMock(return_value=1)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=[order])
+    message.edit_text.side_effect = TelegramBadRequest(
+        method="edit", message="Bad Request: message is not modified"
+    )
+
+    await utils.send_orders_view(message, mock_session, db_user)
+
+    message.edit_text.assert_awaited_once()
+    message.delete.assert_not_awaited()
+    message.answer.assert_not_awaited()
+
+
+async def test_send_orders_view_user_message_not_edited(
+    mock_manager, mock_order_service, mock_session
+):
+    """Test that a user's /orders message is replaced without an edit attempt."""
+    message = AsyncMock()
+    message.from_user.is_bot = False
+    db_user = MagicMock()
+
+    order = MagicMock(spec=OrderDTO)
+    order.id = 10
+    order.status = OrderStatus.PAID
+    order.total_price = 100.0
+
+    mock_order_service.count_user_orders = AsyncMock(return_value=1)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=[order])
+
+    await utils.send_orders_view(message, mock_session, db_user)
+
+    message.edit_text.assert_not_awaited()
+    message.answer.assert_awaited_once()
+
+
+async def test_send_orders_view_keyboard_layout(
+    mock_manager, mock_order_service, mock_session
+):
+    """Test one order per row plus a single navigation row on a middle page."""
+    message = AsyncMock()
+    db_user = MagicMock()
+    db_user.id = 1
+
+    orders = []
+    for order_id in (6, 7):
+        order = MagicMock(spec=OrderDTO)
+        order.id = order_id
+        order.status = OrderStatus.PAID
+        order.total_price = 10.0
+        orders.append(order)
+
+    mock_order_service.count_user_orders = AsyncMock(return_value=12)
+    mock_order_service.list_user_orders_page = AsyncMock(return_value=orders)
+
+    await utils.send_orders_view(message, mock_session, db_user, page=2)
+
+    keyboard = message.edit_text.call_args.kwargs["reply_markup"]
+    rows = keyboard.inline_keyboard
+    assert [button.callback_data for button in rows[0]] == [
+        utils.OrderCallbackFactory(action="view_details", item_id=6).pack()
+    ]
+    assert len(rows) == 3
+    assert [button.text for button in rows[2]] == ["⬅️", "➡️"]
+    assert rows[2][0].callback_data == (
+        utils.OrderCallbackFactory(action="list", item_id=1).pack()
+    )
@@ -12,6 +12,8 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
 from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery
+from aiogram.types import User as TelegramUser
 import pytest
 from pytest_mock import MockerFixture
 
@@ -20,6 +22,7 @@ from ecombot.bot.handlers.profile import address_management
 from ecombot.bot.handlers.profile.states import AddAddress
 from ecombot.db.models import DeliveryAddress
 from ecombot.db.models import User
+from ecombot.services.user_service import AddressNotFoundError
 
 
 @pytest.fixture
@@ -70,13 +73,17 @@ async def test_view_address_handler_success(
     mock_addr.address_label = "Home"
     mock_addr.full_address = "123 St"
 
-    mock_user_service.get_all_user_addresses = AsyncMock(return_value=[mock_addr])
+    mock_user_service.get_user_address = AsyncMock(return_value=mock_addr)
 
     await address_management.view_address_handler(
         query, callback_data, mock_session, db_user, callback_message
     )
 
+    mock_user_service.get_user_address.assert_awaited_once_with(mock_session, 123, 10)
     callback_message.edit_text.assert_awaited_once()
+    assert callback_message.edit_text.call_args[0][0] == (
+        "<b>Message text</b>\n\nMessage text\n\nMessage text"
+    )
     query.answer.assert_awaited_once()
 
 
@@ -90,7 +97,9 @@ async def test_view_address_handler_not_found(
     db_user.id = 123
     callback_data = ProfileCallbackFactory(action="view_addr", address_id=999)
 
-    mock_user_service.get_all_user_addresses = AsyncMock(return_value=[])
+    mock_user_service.get_user_address = AsyncMock(
+        side_effect=AddressNotFoundError("Address not found or permission denied.")
+    )
 
     await address_management.view_address_handler(
         query, callback_data, mock_session, db_user, callback_message
@@ -197,17 +206,64 @@ async def test_add_address_get_address_success(
     db_user = MagicMock(spec=User)
     db_user.id = 123
 
-    state.get_data.return_value = {"label": "Home", "address": "123 Main St"}
+    state.get_data.return_value = {"label": "Home"}
     mock_user_service.add_new_address = AsyncMock()
 
     await address_management.add_address_get_address(
         message, state, mock_session, db_user
     )
 
-    state.update_data.assert_awaited_once_with(address="123 Main St")
+    state.get_data.assert_awaited_once()
+    state.update_data.assert_not_awaited()
     mock_user_service.add_new_address.assert_awaited_once_with(
         session=mock_session, user_id=123, label="Home", address="123 Main St"
     )
     message.answer.assert_awaited_once()
     mock_send_view.assert_awaited_once_with(message, mock_session, db_user)
     state.clear.assert_awaited_once()
+
+
+async def _route(query: CallbackQuery):
+    """Return the handler the router would pick for ``query``, if any."""
+    router = address_management.router.callback_query
+    matched, data = await router.check_root_filters(query)
+    if not matched:
+        return None
+    for handler in router.handlers:
+        passed, _ = await handler.check(query, **data)
+        if passed:
+            return handler.callback
+    return None
+
+
+@pytest.mark.parametrize(
+    ("action", "expected"),
+    [
+        ("view_addr", address_management.view_address_handler),
+        ("delete_addr", address_management.delete_address_handler),
+        ("set_default_addr", address_management.set_default_address_handler),
+        ("add_addr", address_management.add_address_start),
+    ],
+)
+async def test_router_dispatches_on_unpacked_action(action, expected):
+    """Callback data is unpacked once by the router and matched by action."""
+    query = CallbackQuery(
+        id="1",
+        from_user=TelegramUser(id=1, is_bot=False, first_name="A"),
+        chat_instance="x",
+        data=ProfileCallbackFactory(action=action, address_id=10).pack(),
+    )
+
+    assert await _route(query) is expected
+
+
+async def test_router_rejects_foreign_callbacks():
+    """Callbacks of other factories are rejected by the router-level filter."""
+    query = CallbackQuery(
+        id="1",
+        from_user=TelegramUser(id=1, is_bot=False, first_name="A"),
+        chat_instance="x",
+        data="cart:add:5",
+    )
+
+    assert await _route(query) is None
@@ -3,13 +3,14 @@ Unit tests for main profile handlers.
 
 This module verifies:
 - Displaying the profile (command and callback).
-- Editing phone number flow.
+- Editing phone number flow, including the single-edit profile refresh.
 - Editing email flow.
 """
 
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 import pytest
 from pytest_mock import MockerFixture
@@ -91,10 +92,13 @@ async def test_edit_phone_start(mock_manager, mock_keyboards):
     callback_message = AsyncMock()
     state = AsyncMock(spec=FSMContext)
 
+    callback_message.message_id = 42
+
     await main_profile.edit_phone_start(query, state, callback_message)
 
     callback_message.edit_text.assert_awaited_once()
     state.set_state.assert_awaited_once_with(EditProfile.getting_phone)
+    state.update_data.assert_awaited_once_with(prompt_message_id=42)
     query.answer.assert_awaited_once()
 
 
@@ -104,12 +108,13 @@ async def test_edit_phone_get_phone_success(
     """Test receiving new phone number."""
     message = AsyncMock()
     message.text = "1234567890"
+    message.chat.id = 555
     state = AsyncMock(spec=FSMContext)
+    state.get_data.return_value = {"prompt_message_id": 42}
     db_user = MagicMock(spec=User)
     db_user.id = 123
 
-    mock_user_service.update_profile_details = AsyncMock()
-    mock_user_service.get_user_profile = AsyncMock(return_value=MagicMock())
+    mock_user_service.update_profile_details = AsyncMock(return_value=MagicMock())
 
     await main_profile.edit_phone_get_phone(message, state, mock_session, db_user)
 
@@ -117,17 +122,65 @@ async def test_edit_phone_get_phone_success(
     mock_user_service.update_profile_details.assert_awaited_once_with(
         session=mock_session, user_id=123, update_data={"phone": "1234567890"}
     )
-    # Verify success message
-    message.answer.assert_awaited()
-    # Verify refresh
-    mock_session.refresh.assert_awaited_once_with(db_user)
+    # The returned profile is rendered as is, without reloading the user
+    mock_session.refresh.assert_not_awaited()
     # Verify cleanup
     message.delete.assert_awaited_once()
     state.clear.assert_awaited_once()
 
-    # Verify profile re-display (profile_handler logic)
-    # message.answer is called twice: once for success msg, once for profile view
-    assert message.answer.await_count == 2
+    # Success notice and profile share one edit of the prompt message
+    message.bot.edit_message_text.assert_awaited_once()
+    kwargs = message.bot.edit_message_text.call_args.kwargs
+    assert kwargs["chat_id"] == 555
+    assert kwargs["message_id"] == 42
+    assert kwargs["text"] == "Message text\n\nProfile Text"
+    message.answer.assert_not_awaited()
+
+
+async def test_edit_phone_get_phone_edit_fails(
+    mock_manager, mock_user_service, mock_utils, mock_keyboards, mock_session
+):
+    """Test falling back to a new message when the prompt can't be edited."""
+    message = AsyncMock()
+    message.text = "1234567890"
+    message.bot.edit_message_text.side_effect = TelegramBadRequest(
+        method=MagicMock(), message="message to edit not found"
+    )
+    state = AsyncMock(spec=FSMContext)
+    state.get_data.return_value = {"prompt_message_id": 42}
+    db_user = MagicMock(spec=User)
+    db_user.id = 123
+
+    mock_user_service.update_profile_details = AsyncMock(return_value=MagicMock())
+
+    await main_profile.edit_phone_get_phone(message, state, mock_session, db_user)
+
+    message.answer.assert_awaited_once()
+    assert message.answer.call_args[0][0] == "Message text\n\nProfile Text"
+    state.clear.assert_awaited_once()
+
+
+async def test_edit_phone_get_phone_delete_fails(
+    mock_manager, mock_user_service, mock_utils, mock_keyboards, mock_session
+):
+    """A failed cleanup of the input message doesn't fail the update."""
+    message = AsyncMock()
+    message.text = "1234567890"
+    message.delete.side_effect = TelegramBadRequest(
+        method=MagicMock(), message="message can't be deleted"
+    )
+    state = AsyncMock(spec=FSMContext)
+    state.get_data.return_value = {"prompt_message_id": 42}
+    db_user = MagicMock(spec=User)
+    db_user.id = 123
+
+    mock_user_service.update_profile_details = AsyncMock(return_value=MagicMock())
+
+    await main_profile.edit_phone_get_phone(message, state, mock_session, db_user)
+
+    message.bot.edit_message_text.assert_awaited_once()
+    message.answer.assert_not_awaited()  # No error reply
+    state.clear.assert_awaited_once()
 
 
 async def test_edit_email_start(mock_manager, mock_keyboards):
@@ -136,10 +189,13 @@ async def test_edit_email_start(mock_manager, mock_keyboards):
     callback_message = AsyncMock()
     state = AsyncMock(spec=FSMContext)
 
+    callback_message.message_id = 42
+
     await main_profile.edit_email_start(query, state, callback_message)
 
     callback_message.edit_text.assert_awaited_once()
     state.set_state.assert_awaited_once_with(EditProfile.getting_email)
+    state.update_data.assert_awaited_once_with(prompt_message_id=42)
     query.answer.assert_awaited_once()
 
 
@@ -150,22 +206,23 @@ async def test_edit_email_get_email_success(
     message = AsyncMock()
     message.text = "test@example.com"
     state = AsyncMock(spec=FSMContext)
+    state.get_data.return_value = {}
     db_user = MagicMock(spec=User)
     db_user.id = 123
 
-    mock_user_service.update_profile_details = AsyncMock()
-    mock_user_service.get_user_profile = AsyncMock(return_value=MagicMock())
+    mock_user_service.update_profile_details = AsyncMock(return_value=MagicMock())
 
     await main_profile.edit_email_get_email(message, state, mock_session, db_user)
 
     mock_user_service.update_profile_details.assert_awaited_once_with(
         session=mock_session, user_id=123, update_data={"email": "test@example.com"}
     )
-    message.answer.assert_awaited()
-    mock_session.refresh.assert_awaited_once_with(db_user)
+    mock_session.refresh.assert_not_awaited()
     message.delete.assert_awaited_once()
     state.clear.assert_awaited_once()
-    assert message.answer.await_count == 2
+    # Without a stored prompt the profile is sent as a single new message
+    message.bot.edit_message_text.assert_not_awaited()
+    message.answer.assert_awaited_once()
 
 
 async def test_edit_email_get_email_error(
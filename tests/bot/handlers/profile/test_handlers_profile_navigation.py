@@ -113,3 +113,19 @@ async def test_cancel_fsm_active_callback_edit_fail():
     # Should fallback to answer()
     query.message.answer.assert_awaited_once_with("Action cancelled.")
     query.answer.assert_awaited_once()
+
+
+async def test_cancel_fsm_active_callback_inaccessible_message():
+    """Test cancel callback with active state on an inaccessible message."""
+    query = AsyncMock(spec=CallbackQuery)
+    query.answer = AsyncMock()
+    query.message = None
+
+    state = AsyncMock(spec=FSMContext)
+    state.get_state = AsyncMock(return_value="SomeState")
+    state.clear = AsyncMock()
+
+    await navigation.cancel_fsm_handler(query, state)
+
+    state.clear.assert_awaited_once()
+    query.answer.assert_awaited_once_with("Action cancelled.", show_alert=True)
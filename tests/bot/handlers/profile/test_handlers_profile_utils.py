@@ -9,10 +9,12 @@ This module verifies:
 
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
+from unittest.mock import call
 
 from aiogram.exceptions import TelegramBadRequest
 import pytest
 from pytest_mock import MockerFixture
+from sqlalchemy.exc import SQLAlchemyError
 
 from ecombot.bot.handlers.profile import utils
 from ecombot.db.models import DeliveryAddress
@@ -24,6 +26,7 @@ def mock_manager(mocker: MockerFixture):
     """Mocks the central manager."""
     manager = mocker.patch("ecombot.bot.handlers.profile.utils.manager")
     manager.get_message.side_effect = lambda section, key, **kwargs: f"[{key}]"
+    manager.get_template.side_effect = lambda section, key: f"[{key}]"
     return manager
 
 
@@ -51,12 +54,13 @@ def test_format_profile_text_full(mock_manager):
     user_profile.first_name = "John"
     user_profile.phone = "1234567890"
     user_profile.email = "john@example.com"
-    user_profile.addresses = [addr]
+    user_profile.default_address = addr
 
     text = utils.format_profile_text(user_profile)
 
     assert "[profile_header]" in text
     assert "[profile_template]" in text
+    mock_manager.get_template.assert_called_once_with("profile", "profile_template")
     # The address is appended directly
     assert "123 Main St" in text
 
@@ -67,7 +71,7 @@ def test_format_profile_text_missing_info(mock_manager):
     user_profile.first_name = "John"
     user_profile.phone = None
     user_profile.email = None
-    user_profile.addresses = []
+    user_profile.default_address = None
 
     text = utils.format_profile_text(user_profile)
 
@@ -78,6 +82,39 @@ def test_format_profile_text_missing_info(mock_manager):
     mock_manager.get_message.assert_any_call("profile", "not_set_text")
 
 
+def test_format_profile_text_template_fallback(mock_manager):
+    """A template with an unknown placeholder is rendered unformatted."""
+    mock_manager.get_template.side_effect = lambda section, key: "[{unknown}]"
+    user_profile = MagicMock(spec=User)
+    user_profile.first_name = "John"
+    user_profile.phone = "123"
+    user_profile.email = "john@example.com"
+    user_profile.default_address = None
+
+    text = utils.format_profile_text(user_profile)
+
+    assert "[{unknown}]" in text
+
+
+def test_format_profile_text_resolves_not_set_once(mock_manager):
+    """The 'not set' fallback is looked up once and skipped when unused."""
+    user_profile = MagicMock(spec=User)
+    user_profile.first_name = "John"
+    user_profile.phone = None
+    user_profile.email = None
+    user_profile.default_address = None
+
+    utils.format_profile_text(user_profile)
+    not_set_call = call("profile", "not_set_text")
+    assert mock_manager.get_message.call_args_list.count(not_set_call) == 1
+
+    mock_manager.get_message.reset_mock()
+    user_profile.phone = "123"
+    user_profile.email = "john@example.com"
+    utils.format_profile_text(user_profile)
+    assert not_set_call not in mock_manager.get_message.call_args_list
+
+
 def test_format_address_management_text_empty(mock_manager):
     """Test formatting address list when empty."""
     text = utils.format_address_management_text([])
@@ -98,6 +135,24 @@ def test_format_address_management_text_populated(mock_manager):
     assert "123 St" in text
 
 
+def test_format_address_management_text_separates_entries(mock_manager):
+    """Entries are separated by a blank line with no trailing whitespace."""
+    home = MagicMock(spec=DeliveryAddress)
+    home.address_label = "Home"
+    home.full_address = "1 <A> St"
+    work = MagicMock(spec=DeliveryAddress)
+    work.address_label = "Work"
+    work.full_address = "2 B St"
+
+    text = utils.format_address_management_text([home, work])
+
+    assert text == (
+        "[address_management_header]"
+        "📍 <b>Home</b>:\n<code>1 &lt;A&gt; St</code>\n\n"
+        "📍 <b>Work</b>:\n<code>2 B St</code>"
+    )
+
+
 async def test_send_address_management_view_success(
     mock_manager, mock_user_service, mock_keyboards, mock_session
 ):
@@ -133,6 +188,28 @@ async def test_send_address_management_view_not_modified(
     message.answer.assert_not_awaited()
 
 
+async def test_send_address_management_view_unchanged(
+    mock_manager, mock_user_service, mock_session
+):
+    """Test that an identical view already on screen is not re-sent."""
+    message = AsyncMock()
+    db_user = MagicMock(spec=User)
+
+    mock_user_service.get_all_user_addresses = AsyncMock(return_value=[])
+
+    await utils.send_address_management_view(message, mock_session, db_user)
+    text = message.edit_text.call_args.args[0]
+    keyboard = message.edit_text.call_args.kwargs["reply_markup"]
+    message.reset_mock()
+    message.html_text = text
+    message.reply_markup = keyboard
+
+    await utils.send_address_management_view(message, mock_session, db_user)
+
+    message.edit_text.assert_not_awaited()
+    message.answer.assert_not_awaited()
+
+
 async def test_send_address_management_view_fallback(
     mock_manager, mock_user_service, mock_session
 ):
@@ -166,3 +243,29 @@ async def test_send_address_management_view_load_error(
     # Should send error message
     args, _ = message.answer.call_args
     assert "[error_addresses_load_failed]" in args[0]
+
+
+def test_log_handler_error_expected_is_warning(mocker: MockerFixture):
+    """Expected failures are logged as a warning without a traceback."""
+    mock_log = mocker.patch("ecombot.bot.handlers.profile.utils.log")
+    error = SQLAlchemyError("connection lost")
+
+    utils.log_handler_error(error, "Failed for user {}", 123)
+
+    mock_log.opt.assert_called_once_with(depth=1)
+    mock_log.opt.return_value.warning.assert_called_once_with(
+        "Failed for user {}: {}", 123, error
+    )
+
+
+def test_log_handler_error_unexpected_keeps_traceback(mocker: MockerFixture):
+    """Unexpected failures are logged as errors with the exception attached."""
+    mock_log = mocker.patch("ecombot.bot.handlers.profile.utils.log")
+    error = KeyError("boom")
+
+    utils.log_handler_error(error, "Failed for user {}", 123)
+
+    mock_log.opt.assert_called_once_with(depth=1, exception=error)
+    mock_log.opt.return_value.error.assert_called_once_with(
+        "Failed for user {}: {}", 123, error
+    )
@@ -13,6 +13,7 @@ from aiogram.types import InlineKeyboardMarkup
 import pytest
 from pytest_mock import MockerFixture
 
+from ecombot.bot.callback_data import AddProductImageCallbackFactory
 from ecombot.bot.callback_data import AdminCallbackFactory
 from ecombot.bot.callback_data import AdminNavCallbackFactory
 from ecombot.bot.callback_data import EditProductCallbackFactory
@@ -28,6 +29,9 @@ def mock_manager(mocker: MockerFixture):
     manager = mocker.patch("ecombot.bot.keyboards.admin.manager")
     # Return a string like "[key]" for any get_message call
     manager.get_message.side_effect = lambda section, key, **kwargs: f"[{key}]"
+    manager.get_templates.side_effect = lambda section, keys: tuple(
+        f"[{key}]" for key in keys
+    )
     return manager
 
 
@@ -45,6 +49,17 @@ def test_get_admin_panel_keyboard(mock_manager):
     assert AdminCallbackFactory(action="add_product").pack() in callbacks
 
 
+def test_get_admin_panel_keyboard_is_reused_per_labels(mock_manager):
+    """The admin panel keyboard is built once per set of localized labels."""
+    assert admin.get_admin_panel_keyboard() is admin.get_admin_panel_keyboard()
+
+    mock_manager.get_templates.side_effect = lambda section, keys: tuple(
+        f"<{key}>" for key in keys
+    )
+    keyboard = admin.get_admin_panel_keyboard()
+    assert keyboard.inline_keyboard[0][0].text == "<add_category>"
+
+
 def test_get_admin_orders_list_keyboard(mock_manager):
     """Test the orders list keyboard."""
     order1 = MagicMock(spec=OrderDTO)
@@ -77,6 +92,13 @@ def test_get_admin_order_filters_keyboard(mock_manager):
     assert AdminCallbackFactory(action="back_main").pack() in callbacks
 
 
+def test_get_admin_order_filters_keyboard_is_reused(mock_manager):
+    """Repeated calls with the same labels share one markup instance."""
+    keyboard = admin.get_admin_order_filters_keyboard()
+    assert admin.get_admin_order_filters_keyboard() is keyboard
+    assert keyboard.inline_keyboard[0][0].text == "[pending]"
+
+
 def test_get_admin_order_details_keyboard_pending(mock_manager):
     """Test order details keyboard for PENDING status."""
     order = MagicMock(spec=OrderDTO)
@@ -129,3 +151,77 @@ def test_get_edit_product_menu_keyboard(mock_manager):
         ).pack()
         in callbacks
     )
+
+
+def test_get_add_product_image_keyboard(mock_manager):
+    """The Done/Skip keyboard is built once per set of localized labels."""
+    keyboard = admin.get_add_product_image_keyboard()
+    callbacks = [btn.callback_data for row in keyboard.inline_keyboard for btn in row]
+
+    assert callbacks == [
+        AddProductImageCallbackFactory(action="done").pack(),
+        AddProductImageCallbackFactory(action="skip").pack(),
+    ]
+    assert admin.get_add_product_image_keyboard() is keyboard
+
+
+def test_get_admin_order_details_keyboard_is_keyed_by_status(mock_manager):
+    """A cached keyboard is reused per status and never served after a change."""
+    order = MagicMock(spec=OrderDTO)
+    order.id = 11
+    order.status = OrderStatus.PENDING
+
+    pending = admin.get_admin_order_details_keyboard(order)
+    assert admin.get_admin_order_details_keyboard(order) is pending
+
+    order.status = OrderStatus.PROCESSING
+    processing = admin.get_admin_order_details_keyboard(order)
+    callbacks = [btn.callback_data for row in processing.inline_keyboard for btn in row]
+
+    assert processing is not pending
+    assert "admin_order_status:11:shipped" in callbacks
+    assert "admin_order_filter:processing" in callbacks
+
+
+def test_get_edit_product_menu_keyboard_is_reused(mock_manager):
+    """Re-rendering the menu for the same product reuses the markup."""
+    keyboard = admin.get_edit_product_menu_keyboard(
+        product_id=6, product_list_message_id=100, category_id=2
+    )
+
+    assert (
+        admin.get_edit_product_menu_keyboard(
+            product_id=6, product_list_message_id=100, category_id=2
+        )
+        is keyboard
+    )
+    assert [len(row) for row in keyboard.inline_keyboard] == [2, 2, 2]
+
+
+@pytest.mark.parametrize(
+    ("status", "next_statuses"),
+    [
+        (OrderStatus.PENDING, ["processing", "cancelled"]),
+        (OrderStatus.PROCESSING, ["pickup_ready", "shipped", "cancelled"]),
+        (OrderStatus.PICKUP_READY, ["paid", "shipped", "cancelled"]),
+        (OrderStatus.SHIPPED, ["paid", "completed", "cancelled"]),
+        (OrderStatus.PAID, ["completed", "cancelled"]),
+        (OrderStatus.REFUNDED, []),
+        (OrderStatus.FAILED, []),
+    ],
+)
+def test_get_admin_order_details_keyboard_transitions(
+    mock_manager, status, next_statuses
+):
+    """Only the next valid statuses are offered, in order, above the back button."""
+    order = MagicMock(spec=OrderDTO)
+    order.id = 12
+    order.status = status
+
+    keyboard = admin.get_admin_order_details_keyboard(order)
+    callbacks = [btn.callback_data for row in keyboard.inline_keyboard for btn in row]
+
+    assert callbacks == [
+        *(f"admin_order_status:12:{value}" for value in next_statuses),
+        f"admin_order_filter:{status.value}",
+    ]
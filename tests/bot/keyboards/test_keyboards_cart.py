@@ -81,3 +81,23 @@ def test_get_cart_keyboard_populated(mock_manager):
     # Check checkout and catalog
     assert "checkout_start" in callbacks
     assert CatalogCallbackFactory(action="back_to_main", item_id=0).pack() in callbacks
+
+
+def test_get_cart_keyboard_row_layout(mock_manager):
+    """Each item gets an action row and a name row, then one footer row."""
+    items = []
+    for item_id in (1, 2):
+        item = MagicMock()
+        item.id = item_id
+        item.quantity = 1
+        item.product.id = 100 + item_id
+        item.product.name = f"Product {item_id}"
+        items.append(item)
+
+    cart_dto = MagicMock(spec=CartDTO)
+    cart_dto.items = items
+
+    keyboard = cart_keyboards.get_cart_keyboard(cart_dto)
+
+    assert [len(row) for row in keyboard.inline_keyboard] == [4, 1, 4, 1, 2]
+    assert keyboard.inline_keyboard[3][0].text == "Product 2"
@@ -89,3 +89,17 @@ def test_get_product_details_keyboard(mock_manager):
 
     # Check Back to Products (view_category)
     assert CatalogCallbackFactory(action="view_category", item_id=5).pack() in callbacks
+
+
+def test_get_product_details_keyboard_is_reused_per_product(mock_manager):
+    """Repeat views of the same product share one markup."""
+    product = MagicMock(spec=ProductDTO)
+    product.id = 51
+    product.category = MagicMock()
+    product.category.id = 5
+
+    keyboard = catalog.get_product_details_keyboard(product)
+    assert catalog.get_product_details_keyboard(product) is keyboard
+
+    product.id = 52
+    assert catalog.get_product_details_keyboard(product) is not keyboard
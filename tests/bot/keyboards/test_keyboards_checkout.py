@@ -5,6 +5,7 @@ This module verifies:
 - Generation of the request contact keyboard (ReplyKeyboardMarkup).
 - Generation of the checkout confirmation keyboard (slow path).
 - Generation of the fast checkout confirmation keyboard (fast path).
+- Generation of the pickup point selection keyboard.
 """
 
 from aiogram.types import InlineKeyboardMarkup
@@ -13,7 +14,10 @@ import pytest
 from pytest_mock import MockerFixture
 
 from ecombot.bot.callback_data import CheckoutCallbackFactory
+from ecombot.bot.callback_data import PickupSelectCallbackFactory
 from ecombot.bot.keyboards import checkout
+from ecombot.schemas.dto import PickupPointDTO
+from ecombot.schemas.enums import DeliveryType
 
 
 @pytest.fixture
@@ -59,3 +63,47 @@ def test_get_fast_checkout_confirmation_keyboard(mock_manager):
     assert CheckoutCallbackFactory(action="confirm").pack() in callbacks
     assert CheckoutCallbackFactory(action="edit_details").pack() in callbacks
     assert CheckoutCallbackFactory(action="cancel").pack() in callbacks
+
+
+def test_static_checkout_keyboards_are_reused(mock_manager):
+    """Label-only checkout keyboards are built once per localized label."""
+    assert (
+        checkout.get_request_contact_keyboard()
+        is checkout.get_request_contact_keyboard()
+    )
+    assert (
+        checkout.get_checkout_confirmation_keyboard()
+        is checkout.get_checkout_confirmation_keyboard()
+    )
+    assert (
+        checkout.get_fast_checkout_confirmation_keyboard()
+        is checkout.get_fast_checkout_confirmation_keyboard()
+    )
+
+    mock_manager.get_message.side_effect = lambda section, key, **kwargs: f"<{key}>"
+    keyboard = checkout.get_request_contact_keyboard()
+    assert keyboard.keyboard[0][0].text == "<share_phone>"
+
+
+def test_get_pickup_point_selection_keyboard():
+    """Test one button per pickup point, each on its own row."""
+    points = [
+        PickupPointDTO(
+            id=pp_id,
+            name=f"Store {pp_id}",
+            address="1 Market St",
+            pickup_type=DeliveryType.PICKUP_STORE,
+            is_active=True,
+        )
+        for pp_id in (1, 2)
+    ]
+
+    keyboard = checkout.get_pickup_point_selection_keyboard(points)
+
+    assert isinstance(keyboard, InlineKeyboardMarkup)
+    assert [len(row) for row in keyboard.inline_keyboard] == [1, 1]
+    assert keyboard.inline_keyboard[0][0].text == "Store 1"
+    assert (
+        keyboard.inline_keyboard[1][0].callback_data
+        == PickupSelectCallbackFactory(pickup_point_id=2).pack()
+    )
@@ -59,3 +59,31 @@ def test_get_cancel_keyboard(mock_manager):
 
     assert "[cancel]" in texts
     assert "cancel_fsm" in callbacks
+
+
+def test_get_cancel_keyboard_is_reused_per_label(mock_manager):
+    """The cancel keyboard is built once per localized label."""
+    assert common.get_cancel_keyboard() is common.get_cancel_keyboard()
+
+    mock_manager.get_message.side_effect = lambda section, key, **kwargs: "Cancelar"
+    keyboard = common.get_cancel_keyboard()
+    assert keyboard.inline_keyboard[0][0].text == "Cancelar"
+
+
+def test_static_button_is_shared_per_label_and_callback():
+    """Fixed buttons are built once per (label, callback) pair."""
+    button = common.static_button("Back", "profile:profile_back_main:")
+
+    assert common.static_button("Back", "profile:profile_back_main:") is button
+    assert common.static_button("Atrás", "profile:profile_back_main:") is not button
+    assert button.callback_data == "profile:profile_back_main:"
+
+
+def test_get_delete_confirmation_keyboard_is_reused(mock_manager):
+    """The same (action, item) confirmation is built once."""
+    keyboard = common.get_delete_confirmation_keyboard("delete_product", 9)
+
+    assert common.get_delete_confirmation_keyboard("delete_product", 9) is keyboard
+    assert common.get_delete_confirmation_keyboard("delete_product", 10) is not (
+        keyboard
+    )
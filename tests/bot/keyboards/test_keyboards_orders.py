@@ -23,6 +23,7 @@ def mock_manager(mocker: MockerFixture):
     """Mocks the central manager to return predictable strings."""
     manager = mocker.patch("ecombot.bot.keyboards.orders.manager")
     manager.get_message.side_effect = lambda section, key, **kwargs: f"[{key}]"
+    manager.get_template.side_effect = lambda section, key: f"[{key} {{order_number}}]"
     return manager
 
 
@@ -56,6 +57,23 @@ def test_get_orders_list_keyboard_populated(mock_manager):
 
     assert OrderCallbackFactory(action="view_details", item_id=10).pack() in callbacks
     assert OrderCallbackFactory(action="view_details", item_id=11).pack() in callbacks
+    assert [btn.text for btn in buttons] == [
+        "[view_order_number ORD-10]",
+        "[view_order_number ORD-11]",
+    ]
+    mock_manager.get_template.assert_called_once_with("keyboards", "view_order_number")
+
+
+def test_get_orders_list_keyboard_label_fallback(mock_manager):
+    """A label template with an unknown placeholder is used unformatted."""
+    mock_manager.get_template.side_effect = lambda section, key: "[{unknown}]"
+    order = MagicMock(spec=OrderDTO)
+    order.id = 10
+    order.order_number = "ORD-10"
+
+    keyboard = orders.get_orders_list_keyboard([order])
+
+    assert keyboard.inline_keyboard[0][0].text == "[{unknown}]"
 
 
 def test_get_order_details_keyboard(mock_manager):
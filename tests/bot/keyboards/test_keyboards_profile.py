@@ -107,3 +107,34 @@ def test_get_address_management_keyboard_populated(mock_manager):
     # Check static buttons
     assert ProfileCallbackFactory(action="add_addr").pack() in callbacks
     assert ProfileCallbackFactory(action="profile_back_main").pack() in callbacks
+
+
+def test_get_address_management_keyboard_one_button_per_row(mock_manager):
+    """Every button sits on its own row, with add/back as the last two."""
+    addr = MagicMock(spec=DeliveryAddressDTO)
+    addr.id = 11
+    addr.is_default = False
+    addr.address_label = "Work"
+
+    keyboard = profile.get_address_management_keyboard([addr])
+
+    assert [len(row) for row in keyboard.inline_keyboard] == [1, 1, 1, 1, 1]
+    assert keyboard.inline_keyboard[0][0].text == "[address_prefix] Work"
+    assert keyboard.inline_keyboard[-1][0].callback_data == (
+        ProfileCallbackFactory(action="profile_back_main").pack()
+    )
+
+
+def test_get_profile_keyboard_is_reused_per_labels(mock_manager):
+    """The profile keyboard is built once per set of localized labels."""
+    assert profile.get_profile_keyboard() is profile.get_profile_keyboard()
+
+    mock_manager.get_message.side_effect = lambda section, key, **kwargs: f"<{key}>"
+    keyboard = profile.get_profile_keyboard()
+    assert keyboard.inline_keyboard[0][0].text == "<edit_phone>"
+
+
+def test_get_address_details_keyboard_is_reused(mock_manager):
+    """The address details keyboard is built once per localized label."""
+    keyboard = profile.get_address_details_keyboard()
+    assert profile.get_address_details_keyboard() is keyboard
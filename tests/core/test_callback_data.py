@@ -5,6 +5,9 @@ This module verifies that the CallbackData definitions correctly pack and unpack
 data, ensuring that prefixes and field types are handled as expected.
 """
 
+from aiogram.filters.callback_data import CallbackData
+import pytest
+
 from ecombot.bot.callback_data import AdminCallbackFactory
 from ecombot.bot.callback_data import AdminNavCallbackFactory
 from ecombot.bot.callback_data import CartCallbackFactory
@@ -14,6 +17,9 @@ from ecombot.bot.callback_data import ConfirmationCallbackFactory
 from ecombot.bot.callback_data import EditProductCallbackFactory
 from ecombot.bot.callback_data import OrderCallbackFactory
 from ecombot.bot.callback_data import ProfileCallbackFactory
+from ecombot.bot.callback_data import pack_cart
+from ecombot.bot.callback_data import pack_catalog
+from ecombot.bot.callback_data import pack_profile
 
 
 def test_admin_callback_factory():
@@ -91,6 +97,22 @@ def test_order_callback_factory():
     assert unpacked_none.item_id is None
 
 
+@pytest.mark.parametrize(
+    "action, item_id",
+    [("view_details", 10), ("list", 1), ("list", None), ("back_to_list", 0)],
+)
+def test_order_callback_factory_fast_pack_parity(action, item_id):
+    """Test fast_pack produces exactly what pack() does."""
+    expected = OrderCallbackFactory(action=action, item_id=item_id).pack()
+    assert OrderCallbackFactory.fast_pack(action, item_id) == expected
+
+
+def test_order_callback_factory_fast_pack_rejects_separator():
+    """Test fast_pack refuses values that would corrupt the wire format."""
+    with pytest.raises(ValueError):
+        OrderCallbackFactory.fast_pack("view:details", 1)
+
+
 def test_edit_product_callback_factory():
     """Test EditProductCallbackFactory packing and unpacking."""
     cb = EditProductCallbackFactory(action="price", product_id=10)
@@ -149,3 +171,42 @@ def test_profile_callback_factory():
     unpacked_none = ProfileCallbackFactory.unpack(packed_none)
     assert unpacked_none.action == "view_main"
     assert unpacked_none.address_id is None
+
+
+@pytest.mark.parametrize(
+    "value", ["profile:delete_addr:5", "profile:manage_addr:", "profile::"]
+)
+def test_profile_callback_factory_unpack_matches_generic(value):
+    """The direct parser yields the same model as aiogram's generic unpack."""
+    generic = CallbackData.unpack.__func__(ProfileCallbackFactory, value)
+
+    assert ProfileCallbackFactory.unpack(value) == generic
+
+
+@pytest.mark.parametrize(
+    ("value", "error"),
+    [
+        ("profile:edit_phone", TypeError),
+        ("profile:a:1:2", TypeError),
+        ("cart:add:1", ValueError),
+        ("profile:delete_addr:abc", ValueError),
+    ],
+)
+def test_profile_callback_factory_unpack_rejects(value, error):
+    """Malformed data raises the errors CallbackQueryFilter treats as no match."""
+    with pytest.raises(error):
+        ProfileCallbackFactory.unpack(value)
+
+
+def test_cached_pack_helpers_match_pack():
+    """The cached helpers return exactly what the factories' pack() does."""
+    assert pack_cart("remove", 7) == (
+        CartCallbackFactory(action="remove", item_id=7).pack()
+    )
+    assert pack_catalog("view_product", 3) == (
+        CatalogCallbackFactory(action="view_product", item_id=3).pack()
+    )
+    assert pack_profile("delete_addr", 5) == (
+        ProfileCallbackFactory(action="delete_addr", address_id=5).pack()
+    )
+    assert pack_profile("add_addr") == ProfileCallbackFactory(action="add_addr").pack()
@@ -61,6 +61,19 @@ def test_get_message_valid_category(mock_managers):
     )
 
 
+def test_get_message_without_kwargs_uses_template(mock_managers):
+    """Test that plain messages are served from the memoized template."""
+    manager = CentralizedManager()
+    mock_cart_instance = mock_managers["cart"].return_value
+    mock_cart_instance.get_template.return_value = "Cart Template"
+
+    result = manager.get_message("cart", "welcome")
+
+    assert result == "Cart Template"
+    mock_cart_instance.get_template.assert_called_once_with("welcome", None)
+    mock_cart_instance.get_message.assert_not_called()
+
+
 def test_get_message_invalid_category(mock_managers):
     """Test retrieving a message from a non-existent category."""
     manager = CentralizedManager()
@@ -71,6 +84,38 @@ def test_get_message_invalid_category(mock_managers):
     assert result == "some_key"
 
 
+def test_get_template_valid_category(mock_managers):
+    """Test retrieving a raw template from a valid category."""
+    manager = CentralizedManager()
+    mock_orders_instance = mock_managers["orders"].return_value
+    mock_orders_instance.get_template.return_value = "{name} x{quantity}"
+
+    result = manager.get_template("orders", "order_item_template")
+
+    assert result == "{name} x{quantity}"
+    mock_orders_instance.get_template.assert_called_once_with(
+        "order_item_template", None
+    )
+
+
+def test_get_template_invalid_category(mock_managers):
+    """Test retrieving a template from a non-existent category."""
+    manager = CentralizedManager()
+
+    assert manager.get_template("unknown_category", "some_key") == "some_key"
+
+
+def test_get_templates_delegates_to_category(mock_managers):
+    """Test that batched template lookups go to the category manager."""
+    manager = CentralizedManager()
+    mock_cart_instance = mock_managers["cart"].return_value
+    mock_cart_instance.get_templates.return_value = ("A", "B")
+
+    assert manager.get_templates("cart", ("a", "b")) == ("A", "B")
+    mock_cart_instance.get_templates.assert_called_once_with(("a", "b"), None)
+    assert manager.get_templates("unknown", ("a", "b")) == ("a", "b")
+
+
 def test_get_commands(mock_managers):
     """Test retrieving commands."""
     manager = CentralizedManager()
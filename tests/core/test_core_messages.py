@@ -6,6 +6,7 @@ import pytest
 
 from ecombot.core.messages import BaseMessageManager
 from ecombot.core.messages import Language
+from ecombot.core.messages import render_template
 
 
 class ConcreteMessageManager(BaseMessageManager):
@@ -73,6 +74,13 @@ def test_get_message_formatting_error(message_manager):
     assert msg == "Hello, {name}!"
 
 
+def test_render_template_falls_back_on_bad_values():
+    """Test render_template returns the raw template when formatting fails."""
+    assert render_template("Hello, {name}!", {"name": "Bob"}) == "Hello, Bob!"
+    assert render_template("Hello, {name}!", {}) == "Hello, {name}!"
+    assert render_template("Total: {total:d}", {"total": "x"}) == "Total: {total:d}"
+
+
 def test_add_message(message_manager):
     """Test adding a new message dynamically."""
     message_manager.add_message("new_key", "New Message", Language.EN)
@@ -85,6 +93,60 @@ def test_add_message(message_manager):
     assert msg_fr == "Nouveau Message"
 
 
+def test_get_template_returns_unformatted(message_manager):
+    """Test retrieving the raw template without applying formatting."""
+    assert message_manager.get_template("hello", Language.ES) == "Hola, {name}!"
+    assert message_manager.get_template("only_en", Language.ES) == "Only in English"
+    assert message_manager.get_template("missing", Language.EN) == "missing"
+
+
+def test_get_template_is_memoized(message_manager):
+    """Test that resolved templates are served from the cache."""
+    message_manager.get_template("welcome", Language.ES)
+    message_manager._messages[Language.ES]["welcome"] = "Changed"
+
+    assert message_manager.get_template("welcome", Language.ES) == "Bienvenido al bot."
+
+
+def test_get_template_default_language_is_memoized_separately(message_manager):
+    """Test that implicit and explicit default-language lookups agree."""
+    assert message_manager.get_template("welcome") == "Welcome to the bot."
+    assert message_manager.get_template("welcome", Language.EN) == (
+        "Welcome to the bot."
+    )
+    message_manager.add_message("welcome", "Welcome back.", Language.EN)
+
+    assert message_manager.get_template("welcome") == "Welcome back."
+    assert message_manager.get_template("welcome", Language.EN) == "Welcome back."
+
+
+def test_get_templates_resolves_keys_in_order(message_manager):
+    """Test fetching several templates at once, with fallbacks applied."""
+    keys = ("welcome", "only_en", "missing")
+
+    assert message_manager.get_templates(keys, Language.ES) == (
+        "Bienvenido al bot.",
+        "Only in English",
+        "missing",
+    )
+    assert message_manager.get_templates(keys) is message_manager.get_templates(keys)
+
+    message_manager.add_message("welcome", "Welcome back.", Language.EN)
+    assert message_manager.get_templates(keys)[0] == "Welcome back."
+
+
+def test_add_message_invalidates_template_cache(message_manager):
+    """Test that adding a message is visible to subsequent lookups."""
+    assert message_manager.get_message("welcome", language=Language.ES) == (
+        "Bienvenido al bot."
+    )
+    message_manager.add_message("welcome", "Hola otra vez.", Language.ES)
+
+    assert message_manager.get_message("welcome", language=Language.ES) == (
+        "Hola otra vez."
+    )
+
+
 def test_get_supported_languages(message_manager):
     """Test retrieving supported languages."""
     langs = message_manager.get_supported_languages()
@@ -5,11 +5,14 @@ This module verifies:
 - DbSessionMiddleware: Session creation, injection, commit, and rollback.
 - MessageInteractionMiddleware: Validation of CallbackQuery messages.
 - UserMiddleware: User retrieval/creation and command setting.
+- FloodControlMiddleware: global pacing, RetryAfter back-off and bounded retries.
 """
 
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
 from aiogram.types import CallbackQuery
 from aiogram.types import Message
 from aiogram.types import User as TelegramUser
@@ -17,6 +20,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from ecombot.bot.middlewares import DbSessionMiddleware
+from ecombot.bot.middlewares import FloodControlMiddleware
 from ecombot.bot.middlewares import MessageInteractionMiddleware
 from ecombot.bot.middlewares import UserMiddleware
 from ecombot.db.models import User as DBUser
@@ -181,3 +185,79 @@ async def test_user_middleware_skip_no_user(mock_crud_user):
     handler.assert_awaited_once()
     mock_crud_user.assert_not_awaited()
     assert "db_user" not in data
+
+
+# --- FloodControlMiddleware Tests ---
+
+
+@pytest.fixture
+def mock_sleep(mocker: MockerFixture):
+    return mocker.patch("ecombot.bot.middlewares.asyncio.sleep", new_callable=AsyncMock)
+
+
+async def test_flood_control_middleware_passes_through(mock_sleep):
+    """Test that requests go straight through when no limit is active."""
+    middleware = FloodControlMiddleware()
+    method = SendMessage(chat_id=1, text="hi")
+    make_request = AsyncMock(return_value="response")
+
+    result = await middleware(make_request, MagicMock(), method)
+
+    assert result == "response"
+    make_request.assert_awaited_once()
+    mock_sleep.assert_not_awaited()
+
+
+async def test_flood_control_middleware_paces_bursts(mock_sleep):
+    """Test that requests beyond the burst allowance are spaced out."""
+    middleware = FloodControlMiddleware(rate_limit=3)
+    method = SendMessage(chat_id=1, text="hi")
+
+    for _ in range(3):
+        await middleware(AsyncMock(), MagicMock(), method)
+    mock_sleep.assert_not_awaited()
+
+    await middleware(AsyncMock(), MagicMock(), method)
+    mock_sleep.assert_awaited_once()
+    assert 0 < mock_sleep.call_args[0][0] <= 1 / 3
+
+
+async def test_flood_control_middleware_waits_and_retries(mock_sleep):
+    """Test that RetryAfter delays the retry and later requests."""
+    middleware = FloodControlMiddleware()
+    method = SendMessage(chat_id=1, text="hi")
+    make_request = AsyncMock(
+        side_effect=[
+            TelegramRetryAfter(
+                method=method, message="Too Many Requests", retry_after=5
+            ),
+            "response",
+        ]
+    )
+
+    result = await middleware(make_request, MagicMock(), method)
+
+    assert result == "response"
+    assert make_request.await_count == 2
+    mock_sleep.assert_awaited_once()
+    assert 0 < mock_sleep.call_args[0][0] <= 5
+
+    # A following request also waits for the shared deadline
+    await middleware(AsyncMock(), MagicMock(), method)
+    assert mock_sleep.await_count == 2
+
+
+async def test_flood_control_middleware_gives_up(mock_sleep):
+    """Test that the error is raised once the retry budget is spent."""
+    middleware = FloodControlMiddleware(max_retries=1)
+    method = SendMessage(chat_id=1, text="hi")
+    make_request = AsyncMock(
+        side_effect=TelegramRetryAfter(
+            method=method, message="Too Many Requests", retry_after=1
+        )
+    )
+
+    with pytest.raises(TelegramRetryAfter):
+        await middleware(make_request, MagicMock(), method)
+
+    assert make_request.await_count == 2
@@ -100,26 +100,25 @@ async def test_create_order_product_not_found(mock_session: AsyncMock):
 async def test_get_order(mock_session: AsyncMock):
     """
     Test fetching a single order.
-    Verifies that the manual loading of products (including deleted ones) occurs.
+    Verifies that items and products are eager-loaded by the single statement
+    rather than by one extra query per item.
     """
-    order = Order(id=1, items=[OrderItem(product_id=10)])
     product = Product(id=10, name="Test Product")
+    order = Order(id=1, items=[OrderItem(product_id=10, product=product)])
 
-    # 1. Mock result for get_order query
     mock_order_result = MagicMock()
     mock_order_result.scalars.return_value.first.return_value = order
-
-    # 2. Mock result for the product query inside the loop
-    mock_product_result = MagicMock()
-    mock_product_result.scalars.return_value.first.return_value = product
-
-    mock_session.execute.side_effect = [mock_order_result, mock_product_result]
+    mock_session.execute.return_value = mock_order_result
 
     result = await orders_crud.get_order(mock_session, 1)
 
     assert result == order
     assert result.items[0].product == product
-    assert mock_session.execute.call_count == 2
+    mock_session.execute.assert_awaited_once()
+
+    stmt = mock_session.execute.call_args.args[0]
+    loaded_paths = {str(opt.path) for opt in stmt._with_options}
+    assert any("OrderItem.product" in path for path in loaded_paths)
 
 
 async def test_get_orders_by_user_pk(mock_session: AsyncMock):
@@ -133,6 +132,27 @@ async def test_get_orders_by_user_pk(mock_session: AsyncMock):
     mock_session.execute.assert_called_once()
 
 
+async def test_get_orders_by_user_pk_paginated(mock_session: AsyncMock):
+    """Test that limit/offset are pushed into the SQL statement."""
+    mock_session.execute.return_value.scalars.return_value.all.return_value = []
+
+    await orders_crud.get_orders_by_user_pk(mock_session, 1, limit=5, offset=10)
+
+    stmt = mock_session.execute.call_args.args[0]
+    assert stmt._limit == 5
+    assert stmt._offset == 10
+
+
+async def test_count_orders_by_user_pk(mock_session: AsyncMock):
+    """Test counting a user's orders."""
+    mock_session.execute.return_value.scalar_one.return_value = 7
+
+    result = await orders_crud.count_orders_by_user_pk(mock_session, 1)
+
+    assert result == 7
+    mock_session.execute.assert_called_once()
+
+
 async def test_get_orders_by_status(mock_session: AsyncMock):
     """Test fetching orders filtered by status."""
     order = Order(id=1, status=OrderStatus.PAID, items=[])
@@ -2,6 +2,11 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
 from sqlalchemy import Delete
+from sqlalchemy import Update
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
 
 from ecombot.db.crud import users as users_crud
 from ecombot.db.models import DeliveryAddress
@@ -39,21 +44,26 @@ async def test_get_or_create_user_new(mock_session: AsyncMock):
     assert result.username == "testuser"
     mock_session.add.assert_called_once_with(result)
     mock_session.flush.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result, attribute_names=["addresses"])
+    mock_session.refresh.assert_awaited_once_with(
+        result, attribute_names=["default_address"]
+    )
 
 
 async def test_update_user_profile_success(mock_session: AsyncMock):
-    """Test updating valid user profile fields."""
-    user = User(id=1, phone="123", email="old@example.com")
-    mock_session.get.return_value = user
+    """Test updating valid user profile fields in a single statement."""
+    user = User(id=1, phone="555-5555", email="new@example.com")
+    mock_session.execute.return_value.scalar_one_or_none.return_value = user
 
     update_data = {"phone": "555-5555", "email": "new@example.com"}
     result = await users_crud.update_user_profile(mock_session, 1, update_data)
 
-    assert result == user
-    assert result.phone == "555-5555"
-    assert result.email == "new@example.com"
-    mock_session.flush.assert_awaited_once()
+    assert result is user
+    mock_session.execute.assert_awaited_once()
+    mock_session.get.assert_not_awaited()
+    stmt = mock_session.execute.call_args[0][0]
+    assert isinstance(stmt, Update)
+    assert stmt._returning
+    assert {col.key for col in stmt._values} == {"phone", "email"}
 
 
 async def test_update_user_profile_invalid_fields(mock_session: AsyncMock):
@@ -67,7 +77,7 @@ async def test_update_user_profile_invalid_fields(mock_session: AsyncMock):
 
     assert result == user
     assert result.username == "original_user"  # Should not change
-    mock_session.flush.assert_awaited_once()
+    mock_session.execute.assert_not_awaited()
 
 
 async def test_get_user_addresses(mock_session: AsyncMock):
@@ -81,6 +91,20 @@ async def test_get_user_addresses(mock_session: AsyncMock):
     mock_session.execute.assert_called_once()
 
 
+async def test_get_user_address(mock_session: AsyncMock):
+    """Test fetching a single address scoped to its owner."""
+    address = DeliveryAddress(id=5, user_id=1, full_address="123 St")
+    mock_session.execute.return_value.scalar_one_or_none.return_value = address
+
+    result = await users_crud.get_user_address(mock_session, 1, 5)
+
+    assert result is address
+    mock_session.execute.assert_called_once()
+    where_sql = str(mock_session.execute.call_args[0][0].whereclause)
+    assert "delivery_addresses.id" in where_sql
+    assert "delivery_addresses.user_id" in where_sql
+
+
 async def test_add_delivery_address(mock_session: AsyncMock):
     """Test adding a new delivery address."""
     result = await users_crud.add_delivery_address(
@@ -97,8 +121,6 @@ async def test_add_delivery_address(mock_session: AsyncMock):
 
 async def test_delete_delivery_address_success(mock_session: AsyncMock):
     """Test successful deletion of an address."""
-    address = DeliveryAddress(id=10, user_id=1)
-    mock_session.get.return_value = address
     mock_session.execute.return_value.rowcount = 1
 
     result = await users_crud.delete_delivery_address(
@@ -106,37 +128,49 @@ async def test_delete_delivery_address_success(mock_session: AsyncMock):
     )
 
     assert result is True
-    # Verify delete statement execution
-    mock_session.execute.assert_called()
-    # Check that the last call was the delete execution
+    # A single DELETE scoped to the user, without a prior lookup
+    mock_session.get.assert_not_called()
+    mock_session.execute.assert_called_once()
     call_args = mock_session.execute.call_args[0][0]
     assert isinstance(call_args, Delete)
     mock_session.flush.assert_awaited_once()
 
 
 async def test_delete_delivery_address_not_found(mock_session: AsyncMock):
-    """Test deletion fails if address does not exist."""
-    mock_session.get.return_value = None
+    """Test deletion fails if no address matches the id and the user."""
+    mock_session.execute.return_value.rowcount = 0
 
     result = await users_crud.delete_delivery_address(
         mock_session, address_id=10, user_id=1
     )
 
     assert result is False
-    mock_session.execute.assert_not_called()
+    statement = mock_session.execute.call_args[0][0]
+    where_sql = str(statement.whereclause)
+    assert "delivery_addresses.id" in where_sql
+    assert "delivery_addresses.user_id" in where_sql
 
 
 async def test_delete_delivery_address_wrong_user(mock_session: AsyncMock):
-    """Test deletion fails if address belongs to another user."""
-    address = DeliveryAddress(id=10, user_id=2)  # Different user
-    mock_session.get.return_value = address
-
-    result = await users_crud.delete_delivery_address(
-        mock_session, address_id=10, user_id=1
-    )
-
-    assert result is False
-    mock_session.execute.assert_not_called()
+    """Test deletion fails and keeps the row if it belongs to another user."""
+    table = DeliveryAddress.__table__
+    engine = create_engine("sqlite://")
+    table.create(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(table).values(
+                id=10, user_id=2, address_label="Home", full_address="1 Main St"
+            )
+        )
+        # Run the real DELETE against the table owned by another user
+        mock_session.execute.side_effect = lambda statement: conn.execute(statement)
+
+        result = await users_crud.delete_delivery_address(
+            mock_session, address_id=10, user_id=1
+        )
+
+        assert result is False
+        assert conn.execute(select(func.count()).select_from(table)).scalar() == 1
 
 
 async def test_set_default_address_success(mock_session: AsyncMock):
@@ -152,9 +186,10 @@ async def test_set_default_address_success(mock_session: AsyncMock):
     assert result == address
     assert address.is_default is True
 
-    # Verify that we executed the update to unset other defaults
+    # One UPDATE flips the flag on all of the user's addresses
     mock_session.execute.assert_called_once()
-    mock_session.flush.assert_awaited_once()
+    statement = mock_session.execute.call_args[0][0]
+    assert isinstance(statement, Update)
 
 
 async def test_set_default_address_not_found(mock_session: AsyncMock):
@@ -169,5 +204,5 @@ async def test_set_default_address_not_found(mock_session: AsyncMock):
     mock_session.get.return_value = address
     result = await users_crud.set_default_address(mock_session, 1, 10)
     assert result is None
-    # Should still execute the unset update, but not flush the specific address update
-    assert mock_session.execute.call_count == 2
+    # The existing default must not be cleared when the target is rejected
+    mock_session.execute.assert_not_called()
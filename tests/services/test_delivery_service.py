@@ -0,0 +1,136 @@
+"""
+Unit tests for the delivery service.
+
+This module verifies:
+- Short-lived caching of delivery availability lookups.
+- Cache invalidation deferred until the session commits.
+"""
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ecombot.db.models import PickupPoint
+from ecombot.schemas.dto import PickupPointDTO
+from ecombot.schemas.enums import DeliveryType
+from ecombot.services import delivery_service
+
+
+@pytest.fixture(autouse=True)
+def reset_delivery_cache():
+    """Ensures every test starts with an empty delivery cache."""
+    delivery_service.reset_delivery_cache()
+    yield
+    delivery_service.reset_delivery_cache()
+
+
+async def test_check_courier_availability_cached(mocker):
+    """Test courier availability is queried once within the TTL."""
+    mocker.patch("ecombot.services.delivery_service.settings.DELIVERY", True)
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = MagicMock()
+    session.execute.return_value = result
+
+    assert await delivery_service.check_courier_availability(session) is True
+    assert await delivery_service.check_courier_availability(session) is True
+    session.execute.assert_awaited_once()
+
+    delivery_service.reset_delivery_cache()
+    assert await delivery_service.check_courier_availability(session) is True
+    assert session.execute.await_count == 2
+
+
+async def test_check_courier_availability_cache_expires(mocker):
+    """Test courier availability is re-queried once the TTL has passed."""
+    mocker.patch("ecombot.services.delivery_service.settings.DELIVERY", True)
+    clock = mocker.patch("ecombot.services.delivery_service.time.monotonic")
+    clock.return_value = 100.0
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = None
+    session.execute.return_value = result
+
+    assert await delivery_service.check_courier_availability(session) is False
+
+    clock.return_value = 100.0 + delivery_service.DELIVERY_CACHE_TTL + 1
+    assert await delivery_service.check_courier_availability(session) is False
+    assert session.execute.await_count == 2
+
+
+async def test_check_courier_availability_delivery_disabled(mocker):
+    """Test the global delivery switch is honoured without a query."""
+    mocker.patch("ecombot.services.delivery_service.settings.DELIVERY", False)
+    session = AsyncMock()
+
+    assert await delivery_service.check_courier_availability(session) is False
+    session.execute.assert_not_called()
+
+
+async def test_get_active_pickup_points_cached():
+    """Test active pickup points are returned as DTOs and cached."""
+    point = PickupPoint(
+        id=1,
+        name="Main Store",
+        address="1 Market St",
+        pickup_type=DeliveryType.PICKUP_STORE,
+        is_active=True,
+    )
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [point]
+    session.execute.return_value = result
+
+    first = await delivery_service.get_active_pickup_points(session)
+    second = await delivery_service.get_active_pickup_points(session)
+
+    assert isinstance(first[0], PickupPointDTO)
+    assert first[0].name == "Main Store"
+    assert first == second
+    session.execute.assert_awaited_once()
+
+
+async def test_get_active_pickup_points_returns_copies():
+    """Mutating a returned list does not touch the cached pickup points."""
+    point = PickupPoint(
+        id=1,
+        name="Main Store",
+        address="1 Market St",
+        pickup_type=DeliveryType.PICKUP_STORE,
+        is_active=True,
+    )
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [point]
+    session.execute.return_value = result
+
+    first = await delivery_service.get_active_pickup_points(session)
+    first.clear()
+    second = await delivery_service.get_active_pickup_points(session)
+
+    assert len(second) == 1
+    session.execute.assert_awaited_once()
+
+
+async def test_reset_delivery_cache_on_commit_waits_for_commit(mocker):
+    """Test the cache survives until the admin's transaction commits."""
+    mocker.patch("ecombot.services.delivery_service.settings.DELIVERY", True)
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = MagicMock()
+    session.execute.return_value = result
+    assert await delivery_service.check_courier_availability(session) is True
+
+    admin_session = AsyncSession()
+    delivery_service.reset_delivery_cache_on_commit(admin_session)
+
+    # Before the commit, checkouts keep reading the cached value
+    assert await delivery_service.check_courier_availability(session) is True
+    session.execute.assert_awaited_once()
+
+    sync_session = admin_session.sync_session
+    sync_session.dispatch.after_commit(sync_session)
+    assert await delivery_service.check_courier_availability(session) is True
+    assert session.execute.await_count == 2
@@ -98,3 +98,31 @@ async def test_list_user_orders(mocker: MockerFixture, mock_session: AsyncMock):
 
     mock_get_orders.assert_awaited_once_with(mock_session, user_id)
     assert len(result) == 2
+
+
+async def test_list_user_orders_page(mocker: MockerFixture, mock_session: AsyncMock):
+    """Test listing a single page of user orders."""
+    mock_get_orders = mocker.patch(
+        "ecombot.services.order_service.crud.get_orders_by_user_pk",
+        new_callable=AsyncMock,
+        return_value=[MagicMock(spec=Order)],
+    )
+    mocker.patch("ecombot.schemas.dto.OrderDTO.model_validate")
+
+    result = await order_service.list_user_orders_page(
+        mock_session, 123, limit=5, offset=5
+    )
+
+    mock_get_orders.assert_awaited_once_with(mock_session, 123, limit=5, offset=5)
+    assert len(result) == 1
+
+
+async def test_count_user_orders(mocker: MockerFixture, mock_session: AsyncMock):
+    """Test counting user orders."""
+    mocker.patch(
+        "ecombot.services.order_service.crud.count_orders_by_user_pk",
+        new_callable=AsyncMock,
+        return_value=3,
+    )
+
+    assert await order_service.count_user_orders(mock_session, 123) == 3
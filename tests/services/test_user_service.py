@@ -1,9 +1,9 @@
 from unittest.mock import AsyncMock
-from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
 
+from ecombot.db.models import DeliveryAddress
 from ecombot.db.models import User
 from ecombot.services import user_service
 from ecombot.services.user_service import AddressNotFoundError
@@ -13,12 +13,12 @@ async def test_update_profile_details(mocker: MockerFixture, mock_session: Async
     """Tests updating user profile."""
     user_id = 1
     update_data = {"phone": "555-5555"}
-    mock_user = MagicMock(spec=User)
+    user = User(id=user_id, telegram_id=100, first_name="John")
 
     mock_update_crud = mocker.patch(
         "ecombot.services.user_service.crud.update_user_profile",
         new_callable=AsyncMock,
-        return_value=mock_user,
+        return_value=user,
     )
     mocker.patch("ecombot.schemas.dto.UserProfileDTO.model_validate")
 
@@ -27,6 +27,38 @@ async def test_update_profile_details(mocker: MockerFixture, mock_session: Async
     )
 
     mock_update_crud.assert_awaited_once_with(mock_session, user_id, update_data)
+    mock_session.refresh.assert_awaited_once_with(
+        user, attribute_names=["default_address"]
+    )
+
+
+async def test_get_user_profile_uses_loaded_default_address(
+    mocker: MockerFixture, mock_session: AsyncMock
+):
+    """Tests no query is issued when the default address is already loaded."""
+    user = User(id=1, telegram_id=100, first_name="John")
+    user.default_address = None
+    mock_validate = mocker.patch("ecombot.schemas.dto.UserProfileDTO.model_validate")
+
+    result = await user_service.get_user_profile(mock_session, user)
+
+    mock_session.refresh.assert_not_awaited()
+    mock_validate.assert_called_once_with(user)
+    assert result == mock_validate.return_value
+
+
+async def test_get_user_profile_reloads_expired_default_address(
+    mocker: MockerFixture, mock_session: AsyncMock
+):
+    """Tests only the default address is reloaded when it is not loaded."""
+    user = User(id=1, telegram_id=100, first_name="John")
+    mocker.patch("ecombot.schemas.dto.UserProfileDTO.model_validate")
+
+    await user_service.get_user_profile(mock_session, user)
+
+    mock_session.refresh.assert_awaited_once_with(
+        user, attribute_names=["default_address"]
+    )
 
 
 async def test_delete_address_success(mocker: MockerFixture, mock_session: AsyncMock):
@@ -59,6 +91,38 @@ async def test_delete_address_not_found(mocker: MockerFixture, mock_session: Asy
         await user_service.delete_address(mock_session, 1, 101)
 
 
+async def test_get_user_address(mocker: MockerFixture, mock_session: AsyncMock):
+    """Test fetching a single address as a DTO."""
+    address = DeliveryAddress(
+        id=5, user_id=1, address_label="Home", full_address="123 St", is_default=True
+    )
+    mock_get_crud = mocker.patch(
+        "ecombot.services.user_service.crud.get_user_address",
+        new_callable=AsyncMock,
+        return_value=address,
+    )
+
+    result = await user_service.get_user_address(mock_session, 1, 5)
+
+    mock_get_crud.assert_awaited_once_with(mock_session, 1, 5)
+    assert result.id == 5
+    assert result.address_label == "Home"
+
+
+async def test_get_user_address_not_found(
+    mocker: MockerFixture, mock_session: AsyncMock
+):
+    """Test that a missing or foreign address raises AddressNotFoundError."""
+    mocker.patch(
+        "ecombot.services.user_service.crud.get_user_address",
+        new_callable=AsyncMock,
+        return_value=None,
+    )
+
+    with pytest.raises(AddressNotFoundError):
+        await user_service.get_user_address(mock_session, 1, 999)
+
+
 async def test_add_new_address(mocker: MockerFixture, mock_session: AsyncMock):
     """Test adding a new address."""
     mock_add_crud = mocker.patch(
@@ -0,0 +1,29 @@
+"""
+Unit tests for general application utilities.
+
+This module verifies:
+- Memoized datetime formatting, including time zone handling.
+"""
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from ecombot.utils import format_datetime
+
+
+def test_format_datetime_matches_strftime():
+    """Test the memoized formatter returns the same text as strftime."""
+    value = datetime(2024, 5, 1, 12, 30)
+    assert format_datetime(value, "%Y-%m-%d %H:%M") == "2024-05-01 12:30"
+    assert format_datetime(value, "%d.%m.%Y") == "01.05.2024"
+
+
+def test_format_datetime_distinguishes_time_zones():
+    """Test equal instants in different zones are not served from one entry."""
+    utc_value = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    local_value = utc_value.astimezone(timezone(timedelta(hours=3)))
+    assert utc_value == local_value
+
+    assert format_datetime(utc_value, "%H:%M") == "12:30"
+    assert format_datetime(local_value, "%H:%M") == "15:30"